@@ -6,11 +6,12 @@ This example demonstrates simple single-file transcription using the
 PersianAudioTranscriber Python API.
 """
 
+import sys
 from pathlib import Path
-from persian_transcriber import PersianAudioTranscriber
+from persian_transcriber import TranscriptionResult, get_transcriber
 from persian_transcriber.config import TranscriberConfig, EngineConfig, OutputConfig
 from persian_transcriber.engines import EngineType
-from persian_transcriber.output import OutputFormat
+from persian_transcriber.output import JsonFormatter, OutputFormat, SrtFormatter, TxtFormatter
 
 
 def example_1_simple_transcription() -> None:
@@ -20,7 +21,7 @@ def example_1_simple_transcription() -> None:
     print("=" * 60)
 
     # Create transcriber with default settings
-    transcriber = PersianAudioTranscriber()
+    transcriber = get_transcriber()
 
     # Transcribe a file
     audio_file = "audio.mp3"  # Replace with your audio file
@@ -36,15 +37,27 @@ def example_1_simple_transcription() -> None:
 
 
 def example_2_custom_model() -> None:
-    """Example 2: Transcription with custom model and device."""
+    """
+    Example 2: Transcription with custom model and device.
+
+    Uses int8_float16 precision: weights are stored as int8 while
+    activations and matmuls run in FP16 on Tensor Cores. Decoding is
+    memory-bandwidth bound, so halving the weight size roughly halves
+    VRAM use (~3 GB instead of ~6 GB for large-v3).
+
+    large-v3-turbo keeps the large-v3 encoder but prunes the decoder from
+    32 layers to 4, so decoding runs several times faster at nearly the
+    same accuracy.
+    """
     print("\n" + "=" * 60)
     print("Example 2: Custom Model Configuration")
     print("=" * 60)
 
     # Create transcriber with specific model and GPU
-    transcriber = PersianAudioTranscriber(
-        model_size="large-v3",  # Use largest, most accurate model
+    transcriber = get_transcriber(
+        model_size="large-v3-turbo",  # large-v3 accuracy, 4-layer decoder
         device="cuda",  # Use GPU acceleration
+        compute_type="int8_float16",  # int8 weights, FP16 compute
         language="fa",  # Specify Persian/Farsi
         verbose=True,  # Show detailed progress
     )
@@ -67,7 +80,12 @@ def example_3_with_config_object() -> None:
             type=EngineType.FASTER_WHISPER,  # Use faster CTranslate2 backend
             model_size="medium",
             device="cuda",
-            compute_type="float16",  # Mixed precision for speed
+            # Let CTranslate2 pick the narrowest supported type:
+            # int8_float16 on SM>=7.5 GPUs, float16 on older GPUs, int8 on CPU
+            compute_type="auto",
+            # With device="cpu" on Cooper Lake or newer Xeons (AVX512_BF16),
+            # compute_type="bfloat16" is about 2x float32 speed with better
+            # accuracy than int8; "auto_accurate" picks it when available.
         ),
         output=OutputConfig(
             format=OutputFormat.JSON,  # Get detailed JSON output
@@ -76,8 +94,20 @@ def example_3_with_config_object() -> None:
         ),
     )
 
+    # TensorRT variant: run the encoder as a TensorRT engine (CUDA only).
+    # Export the encoder first, e.g.:
+    #   optimum-cli export onnx --model openai/whisper-large-v3 whisper-onnx/
+    # config = TranscriberConfig(
+    #     engine=EngineConfig(
+    #         type=EngineType.WHISPER_TRT,
+    #         model_size="large-v3",
+    #         encoder_onnx="whisper-onnx/encoder_model.onnx",
+    #         compute_type="fp16",  # TensorRT precision: "fp16" or "int8"
+    #     ),
+    # )
+
     # Create transcriber with config
-    transcriber = PersianAudioTranscriber(config=config)
+    transcriber = get_transcriber(config=config)
 
     audio_file = "audio.mp3"
     if Path(audio_file).exists():
@@ -88,10 +118,14 @@ def example_3_with_config_object() -> None:
         if "segments" in result:
             print(f"\nNumber of segments: {len(result['segments'])}")
             print("\nFirst 3 segments:")
-            for i, segment in enumerate(result["segments"][:3], 1):
-                print(f"\n  Segment {i}:")
-                print(f"    Time: {segment['start']:.2f}s - {segment['end']:.2f}s")
-                print(f"    Text: {segment['text']}")
+            # One write for all segments instead of three print() calls each
+            lines = (
+                f"\n  Segment {i}:\n"
+                f"    Time: {segment['start']:.2f}s - {segment['end']:.2f}s\n"
+                f"    Text: {segment['text']}"
+                for i, segment in enumerate(result["segments"][:3], 1)
+            )
+            sys.stdout.write("\n".join(lines) + "\n")
 
 
 def example_4_save_to_file() -> None:
@@ -105,20 +139,18 @@ def example_4_save_to_file() -> None:
         print(f"Audio file not found: {audio_file}")
         return
 
-    # Save as plain text
-    transcriber_txt = PersianAudioTranscriber(output_format="txt")
-    result = transcriber_txt.transcribe_file(audio_file, output_path="output.txt")
-    print(f"Saved plain text to: output.txt")
-
-    # Save as SRT subtitles
-    transcriber_srt = PersianAudioTranscriber(output_format="srt")
-    result = transcriber_srt.transcribe_file(audio_file, output_path="output.srt")
-    print(f"Saved SRT subtitles to: output.srt")
+    # Transcribe once; the formats only differ in how the result is written
+    transcriber = get_transcriber()
+    output = transcriber.transcribe_file(audio_file, save_output=False)
+    result = TranscriptionResult.from_dict(output)
 
-    # Save as JSON with full details
-    transcriber_json = PersianAudioTranscriber(output_format="json")
-    result = transcriber_json.transcribe_file(audio_file, output_path="output.json")
-    print(f"Saved JSON data to: output.json")
+    for formatter, output_path, label in (
+        (TxtFormatter(), "output.txt", "plain text"),
+        (SrtFormatter(), "output.srt", "SRT subtitles"),
+        (JsonFormatter(), "output.json", "JSON data"),
+    ):
+        formatter.save(result, output_path)
+        print(f"Saved {label} to: {output_path}")
 
 
 def example_5_error_handling() -> None:
@@ -133,7 +165,7 @@ def example_5_error_handling() -> None:
         EngineError,
     )
 
-    transcriber = PersianAudioTranscriber()
+    transcriber = get_transcriber()
 
     audio_files = ["audio1.mp3", "audio2.wav", "nonexistent.mp3"]
 
@@ -166,14 +198,14 @@ def example_6_openai_api() -> None:
     print("=" * 60)
 
     # Option 1: Pass API key directly
-    transcriber = PersianAudioTranscriber(
+    transcriber = get_transcriber(
         engine="openai_api",
         openai_api_key="sk-proj-YOUR_API_KEY_HERE",  # Replace with your key
     )
 
     # Option 2: Use environment variable (recommended)
     # Set OPENAI_API_KEY environment variable
-    # transcriber = PersianAudioTranscriber(engine="openai_api")
+    # transcriber = get_transcriber(engine="openai_api")
 
     audio_file = "audio.mp3"
     if Path(audio_file).exists():
@@ -183,6 +215,13 @@ def example_6_openai_api() -> None:
     else:
         print(f"Audio file not found: {audio_file}")
 
+    # For many files, upload them concurrently. transcribe_file_async() shares
+    # one pooled (HTTP/2 if h2 is installed) connection set across calls:
+    # async def transcribe_all(files):
+    #     return await asyncio.gather(*(transcriber.transcribe_file_async(f) for f in files))
+    #
+    # results = asyncio.run(transcribe_all(["part1.mp3", "part2.mp3", "part3.mp3"]))
+
     print("\nTo use OpenAI API:")
     print("1. Get API key from https://platform.openai.com/account/api-keys")
     print("2. Set environment variable: export OPENAI_API_KEY='sk-...'")
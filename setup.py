@@ -1,15 +1,15 @@
 """Setup script for Voice Transcription Toolkit."""
 
+import re
 from pathlib import Path
 from setuptools import setup, find_packages
 
 # Read version from persian_transcriber package
 version_file = Path(__file__).parent / "src" / "persian_transcriber" / "__init__.py"
-version = "1.0.0"
-for line in version_file.read_text(encoding="utf-8").splitlines():
-    if line.startswith("__version__"):
-        version = line.split("=")[1].strip().strip('"').strip("'")
-        break
+version_match = re.search(
+    r"^__version__\s*=\s*[\"']([^\"']+)", version_file.read_text(encoding="utf-8"), re.M
+)
+version = version_match.group(1) if version_match else "1.0.0"
 
 # Read long description from README
 readme_file = Path(__file__).parent / "README.md"
@@ -60,7 +60,6 @@ setup(
         "ctranslate2>=4.6.1",
         "openai>=1.86.0",
         "ffmpeg-python>=0.1.17",
-        "pydub>=0.25.1",
         "av>=16.0.1",
         "coloredlogs>=15.0.1",
         "tqdm>=4.67.1",
@@ -72,6 +71,7 @@ setup(
             "torch>=2.0.0",
             "torchaudio>=2.0.0",
         ],
+        "server": ["msgpack>=1.0.0"],
         "dev": [
             "pytest>=8.3.5",
             "pytest-cov>=6.1.1",
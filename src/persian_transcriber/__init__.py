@@ -16,6 +16,10 @@ Quick Transcription:
     >>> result = transcribe_file("audio.mp3")
     >>> print(result["text"])
 
+Shared Transcribers:
+    >>> from persian_transcriber import get_transcriber
+    >>> transcriber = get_transcriber(model_size="medium")  # reused on later calls
+
 Configuration:
     >>> from persian_transcriber import TranscriberConfig, PersianAudioTranscriber
     >>> config = TranscriberConfig(language="fa")
@@ -41,29 +45,75 @@ __author__ = "DarkOracle10"
 __email__ = "darkoracle3860@gmail.com"
 __license__ = "MIT"
 
-# Public API exports
-from .transcriber import PersianAudioTranscriber, transcribe_file
-from .config import (
-    TranscriberConfig,
-    EngineConfig,
-    NormalizerConfig,
-    OutputConfig,
-    DeviceType,
-)
-from .engines.base import EngineType, TranscriptionResult, TranscriptionSegment
-from .normalizers import NormalizerType
-from .output import OutputFormat
-
-# Exception classes
-from .utils.exceptions import (
-    TranscriberError,
-    EngineError,
-    AudioProcessingError,
-    ConfigurationError,
-    CUDAError,
-    APIError,
-    NormalizationError,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+# Public API exports, resolved on first attribute access (PEP 562) so that
+# ``import persian_transcriber`` and ``--help`` stay cheap
+_LAZY_EXPORTS: Dict[str, str] = {
+    # Main classes
+    "PersianAudioTranscriber": ".transcriber",
+    "get_transcriber": ".transcriber",
+    "transcribe_file": ".transcriber",
+    # Configuration
+    "TranscriberConfig": ".config",
+    "EngineConfig": ".config",
+    "NormalizerConfig": ".config",
+    "OutputConfig": ".config",
+    "DeviceType": ".config",
+    # Enums
+    "EngineType": ".engines.base",
+    "NormalizerType": ".normalizers",
+    "OutputFormat": ".output",
+    # Data classes
+    "TranscriptionResult": ".engines.base",
+    "TranscriptionSegment": ".engines.base",
+    # Exceptions
+    "TranscriberError": ".utils.exceptions",
+    "EngineError": ".utils.exceptions",
+    "AudioProcessingError": ".utils.exceptions",
+    "ConfigurationError": ".utils.exceptions",
+    "CUDAError": ".utils.exceptions",
+    "APIError": ".utils.exceptions",
+    "NormalizationError": ".utils.exceptions",
+}
+
+if TYPE_CHECKING:
+    from .config import (
+        DeviceType,
+        EngineConfig,
+        NormalizerConfig,
+        OutputConfig,
+        TranscriberConfig,
+    )
+    from .engines.base import EngineType, TranscriptionResult, TranscriptionSegment
+    from .normalizers import NormalizerType
+    from .output import OutputFormat
+    from .transcriber import PersianAudioTranscriber, get_transcriber, transcribe_file
+    from .utils.exceptions import (
+        APIError,
+        AudioProcessingError,
+        ConfigurationError,
+        CUDAError,
+        EngineError,
+        NormalizationError,
+        TranscriberError,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Import public API objects on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     # Version info
@@ -72,6 +122,7 @@ __all__ = [
     "__license__",
     # Main classes
     "PersianAudioTranscriber",
+    "get_transcriber",
     "transcribe_file",
     # Configuration
     "TranscriberConfig",
@@ -6,63 +6,77 @@ allowing users to transcribe audio and video files from the command line.
 """
 
 import argparse
+import functools
+import os
+import stat
 import sys
+import threading
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Sequence, Tuple, Union
 
-from . import __version__
-from .config import TranscriberConfig, EngineConfig, OutputConfig, DeviceType
-from .engines.base import EngineType
-from .output import OutputFormat
-from .transcriber import PersianAudioTranscriber, SUPPORTED_EXTENSIONS
+from .utils.exceptions import ConfigurationError
 from .utils.logging import setup_logging, get_logger
 
+if TYPE_CHECKING:
+    from .config import TranscriberConfig
+
 logger = get_logger(__name__)
 
+# Choice values for --engine and --format. These mirror EngineType and
+# OutputFormat (checked by the test suite) so that building the parser for
+# --help or --version does not import the engine and output packages.
+ENGINE_CHOICES = ("whisper", "faster_whisper", "whisper_trt", "openai_api", "google")
+FORMAT_CHOICES = ("txt", "json", "srt", "vtt")
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create the argument parser for the CLI."""
-    parser = argparse.ArgumentParser(
-        prog="persian-transcriber",
-        description="Persian Audio & Video Transcription Tool",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  # Transcribe a single file
-  persian-transcriber audio.mp3
+# --compute-type values accepted by the whisper_trt engine (TensorRT encoder
+# precisions, plus float16 as an alias of fp16). fp16 means nothing to
+# CTranslate2, so it is rejected for the other engines up front.
+TRT_COMPUTE_TYPES = ("fp16", "int8", "float16")
+TRT_ONLY_COMPUTE_TYPES = ("fp16",)
 
-  # Transcribe with large model and GPU
-  persian-transcriber audio.mp3 -m large-v3 -d cuda
+# Distribution name used to look up the installed version
+DIST_NAME = "persian-audio-transcriber"
 
-  # Transcribe entire directory
-  persian-transcriber ./recordings/ --recursive
+# Shown when the CLI is run without arguments, without building the parser
+SHORT_USAGE = """\
+usage: persian-transcriber [options] input
+       persian-transcriber serve [options]
 
-  # Output as SRT subtitles
-  persian-transcriber video.mp4 -f srt
+Run 'persian-transcriber --help' for the full list of options.
+"""
 
-  # Use OpenAI API
-  persian-transcriber audio.mp3 -e openai_api --api-key sk-...
 
-For more information, visit: https://github.com/DarkOracle10/persian-audio-transcriber
-        """,
-    )
+class _VersionAction(argparse.Action):
+    """Print the package version, resolving it only when --version is given."""
 
-    # Version
-    parser.add_argument(
-        "--version",
-        "-V",
-        action="version",
-        version=f"%(prog)s {__version__}",
-    )
+    def __init__(self, option_strings: List[str], dest: str = argparse.SUPPRESS, **kwargs: Any):
+        super().__init__(option_strings, dest=dest, nargs=0, default=argparse.SUPPRESS, **kwargs)
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: Union[str, Sequence[Any], None],
+        option_string: Optional[str] = None,
+    ) -> None:
+        parser.exit(message=f"{parser.prog} {_package_version()}\n")
+
+
+def _package_version() -> str:
+    """Get the installed package version."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version(DIST_NAME)
+    except PackageNotFoundError:
+        # Running from a source checkout
+        from . import __version__
+
+        return __version__
 
-    # Input
-    parser.add_argument(
-        "input",
-        nargs="?",
-        type=str,
-        help="Path to audio/video file or directory to transcribe",
-    )
 
+def _add_engine_options(parser: argparse.ArgumentParser) -> None:
+    """Add the engine and language options shared by transcription and serve."""
     # Engine options
     engine_group = parser.add_argument_group("Engine Options")
 
@@ -70,7 +84,7 @@ For more information, visit: https://github.com/DarkOracle10/persian-audio-trans
         "-e",
         "--engine",
         type=str,
-        choices=[e.value for e in EngineType],
+        choices=ENGINE_CHOICES,
         default="faster_whisper",
         help="Transcription engine to use (default: faster_whisper)",
     )
@@ -80,7 +94,7 @@ For more information, visit: https://github.com/DarkOracle10/persian-audio-trans
         "--model",
         type=str,
         default="medium",
-        help="Model size for Whisper engines (tiny, base, small, medium, large-v3)",
+        help="Model size for Whisper engines (tiny, base, small, medium, large-v3, large-v3-turbo)",
     )
 
     engine_group.add_argument(
@@ -95,8 +109,25 @@ For more information, visit: https://github.com/DarkOracle10/persian-audio-trans
     engine_group.add_argument(
         "--compute-type",
         type=str,
-        choices=["float16", "int8", "int8_float16", "float32"],
-        help="Compute type for Faster Whisper (default: auto-detected)",
+        choices=[
+            "auto",
+            "auto_accurate",
+            "float16",
+            "int8",
+            "int8_float16",
+            "bfloat16",
+            "float32",
+            "fp16",
+        ],
+        help="Compute type for Faster Whisper, or TensorRT precision (fp16, int8) "
+        "for whisper_trt (default: auto-detected). auto_accurate avoids int8 and "
+        "uses bfloat16 on AVX512_BF16 CPUs",
+    )
+
+    engine_group.add_argument(
+        "--encoder-onnx",
+        type=str,
+        help="Encoder ONNX export for the whisper_trt engine",
     )
 
     # Language options
@@ -116,6 +147,61 @@ For more information, visit: https://github.com/DarkOracle10/persian-audio-trans
         help="Disable Persian text normalization",
     )
 
+
+@functools.lru_cache(maxsize=1)
+def create_parser() -> argparse.ArgumentParser:
+    """
+    Create the argument parser for the CLI.
+
+    The parser is built once and shared by later calls; parse_args() does
+    not modify it, so callers must not add arguments to the returned object.
+    """
+    parser = argparse.ArgumentParser(
+        prog="persian-transcriber",
+        description="Persian Audio & Video Transcription Tool",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Transcribe a single file
+  persian-transcriber audio.mp3
+
+  # Transcribe with large model and GPU
+  persian-transcriber audio.mp3 -m large-v3 -d cuda
+
+  # Transcribe entire directory
+  persian-transcriber ./recordings/ --recursive
+
+  # Output as SRT subtitles
+  persian-transcriber video.mp4 -f srt
+
+  # Use OpenAI API
+  persian-transcriber audio.mp3 -e openai_api --api-key sk-...
+
+  # Keep a model loaded for later runs with the same engine options
+  persian-transcriber serve -m large-v3 -d cuda
+
+For more information, visit: https://github.com/DarkOracle10/persian-audio-transcriber
+        """,
+    )
+
+    # Version
+    parser.add_argument(
+        "--version",
+        "-V",
+        action=_VersionAction,
+        help="show program's version number and exit",
+    )
+
+    # Input
+    parser.add_argument(
+        "input",
+        nargs="?",
+        type=str,
+        help="Path to audio/video file or directory to transcribe",
+    )
+
+    _add_engine_options(parser)
+
     # Output options
     output_group = parser.add_argument_group("Output Options")
 
@@ -123,7 +209,7 @@ For more information, visit: https://github.com/DarkOracle10/persian-audio-trans
         "-f",
         "--format",
         type=str,
-        choices=[f.value for f in OutputFormat],
+        choices=FORMAT_CHOICES,
         default="txt",
         help="Output format (default: txt)",
     )
@@ -185,6 +271,14 @@ For more information, visit: https://github.com/DarkOracle10/persian-audio-trans
         help="API key for OpenAI (can also use OPENAI_API_KEY env var)",
     )
 
+    server_group = parser.add_argument_group("Server Options")
+
+    server_group.add_argument(
+        "--no-server",
+        action="store_true",
+        help="Transcribe locally even if a 'persian-transcriber serve' process is running",
+    )
+
     # General options
     parser.add_argument(
         "-v",
@@ -203,20 +297,131 @@ For more information, visit: https://github.com/DarkOracle10/persian-audio-trans
     return parser
 
 
-def validate_input(path: str) -> Path:
-    """Validate the input file or directory."""
-    p = Path(path)
+@functools.lru_cache(maxsize=1)
+def create_serve_parser() -> argparse.ArgumentParser:
+    """Create the (cached) argument parser for the ``serve`` subcommand."""
+    parser = argparse.ArgumentParser(
+        prog="persian-transcriber serve",
+        description="Load a model once and answer transcription requests over a Unix socket",
+    )
 
-    if not p.exists():
-        raise FileNotFoundError(f"Input path not found: {path}")
+    _add_engine_options(parser)
+
+    parser.add_argument(
+        "--socket",
+        type=str,
+        help="Socket path (default: $PERSIAN_TRANSCRIBER_SOCKET, $XDG_RUNTIME_DIR or a private temp dir)",
+    )
 
-    if p.is_file() and p.suffix.lower() not in SUPPORTED_EXTENSIONS:
-        raise ValueError(
-            f"Unsupported file format: {p.suffix}\n"
-            f"Supported formats: {', '.join(sorted(SUPPORTED_EXTENSIONS))}"
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Enable verbose output",
+    )
+
+    return parser
+
+
+def build_config(args: argparse.Namespace) -> "TranscriberConfig":
+    """
+    Build a TranscriberConfig from parsed transcription or serve arguments.
+
+    Raises:
+        ConfigurationError: If --compute-type is not valid for --engine.
+    """
+    from .config import EngineConfig, OutputConfig, TranscriberConfig
+
+    compute_type = args.compute_type
+    if args.engine == "whisper_trt":
+        if compute_type is not None and compute_type not in TRT_COMPUTE_TYPES:
+            raise ConfigurationError(
+                f"'{compute_type}' is not a TensorRT precision; "
+                f"use one of {', '.join(TRT_COMPUTE_TYPES)}",
+                config_key="compute_type",
+            )
+    elif compute_type in TRT_ONLY_COMPUTE_TYPES:
+        raise ConfigurationError(
+            f"'{compute_type}' is only supported by the whisper_trt engine; " "use float16 instead",
+            config_key="compute_type",
         )
 
-    return p
+    output_dir = getattr(args, "output_dir", None)
+    config = TranscriberConfig(
+        language=args.language,
+        engine=EngineConfig(
+            type=args.engine,
+            model_size=args.model,
+            device=args.device,
+            compute_type=compute_type,
+            encoder_onnx=args.encoder_onnx,
+        ),
+        output=OutputConfig(
+            format=getattr(args, "format", "txt"),
+            directory=Path(output_dir) if output_dir else None,
+            include_timestamps=getattr(args, "timestamps", False),
+        ),
+        openai_api_key=getattr(args, "api_key", None),
+        verbose=args.verbose,
+    )
+
+    # Disable normalization if requested
+    if args.no_normalize:
+        config.normalizer.enabled = False
+
+    return config
+
+
+def serve_main(argv: List[str]) -> int:
+    """
+    Entry point for ``persian-transcriber serve``.
+
+    Args:
+        argv: Arguments following ``serve``.
+
+    Returns:
+        Exit code (0 for success, non-zero for errors).
+    """
+    from .server import serve
+    from .transcriber import PersianAudioTranscriber
+
+    args = create_serve_parser().parse_args(argv)
+    setup_logging(verbose=args.verbose)
+
+    try:
+        serve(PersianAudioTranscriber(config=build_config(args)), socket_path=args.socket)
+    except KeyboardInterrupt:
+        print("\nServer stopped")
+        return 0
+    except Exception as e:
+        logger.error(str(e))
+        return 1
+
+    return 0
+
+
+def validate_input(path: Union[str, "os.PathLike[str]"]) -> Path:
+    """Validate the input file or directory."""
+    from .transcriber import SUPPORTED_EXTENSIONS
+
+    # Plain string operations; a Path is only built for the return value
+    path = os.fspath(path)
+
+    # One stat() answers both "does it exist" and "is it a regular file"
+    try:
+        mode = os.stat(path).st_mode
+    except OSError:
+        raise FileNotFoundError(f"Input path not found: {path}") from None
+
+    if stat.S_ISREG(mode):
+        ext = os.path.splitext(path)[1]
+        if ext.lower() not in SUPPORTED_EXTENSIONS:
+            raise ValueError(
+                f"Unsupported file format: {ext}\n"
+                f"Supported formats: {', '.join(sorted(SUPPORTED_EXTENSIONS))}"
+            )
+
+    return Path(path)
 
 
 def print_progress(current: int, total: int, filename: str) -> None:
@@ -224,6 +429,53 @@ def print_progress(current: int, total: int, filename: str) -> None:
     print(f"[{current}/{total}] Processing: {filename}", flush=True)
 
 
+def make_progress_printer(
+    flush_every: int = 32,
+    flush_interval: float = 0.25,
+) -> Tuple[Callable[[int, int, str], None], Callable[[], None]]:
+    """
+    Create a buffered progress callback for batch processing.
+
+    Lines are written in batches of flush_every, and anything still pending
+    is written at most flush_interval seconds later, so large directories of
+    short files do not cost one write syscall per file.
+
+    Args:
+        flush_every: Write once this many lines are pending.
+        flush_interval: Maximum seconds a line may stay buffered.
+
+    Returns:
+        Tuple of (progress callback, flush function). Call the flush function
+        when processing ends to write any remaining lines.
+    """
+    buffer: List[str] = []
+    lock = threading.Lock()
+    timer: List[threading.Timer] = []
+
+    def flush() -> None:
+        with lock:
+            if timer:
+                timer.pop().cancel()
+            if buffer:
+                sys.stdout.write("".join(buffer))
+                sys.stdout.flush()
+                buffer.clear()
+
+    def progress(current: int, total: int, filename: str) -> None:
+        with lock:
+            buffer.append(f"[{current}/{total}] Processing: {filename}\n")
+            pending = len(buffer)
+            if pending < flush_every and current < total and not timer:
+                timer.append(threading.Timer(flush_interval, flush))
+                timer[0].daemon = True
+                timer[0].start()
+
+        if pending >= flush_every or current >= total:
+            flush()
+
+    return progress, flush
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     """
     Main entry point for the CLI.
@@ -234,6 +486,21 @@ def main(argv: Optional[List[str]] = None) -> int:
     Returns:
         Exit code (0 for success, non-zero for errors).
     """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Trivial invocations are answered without building the full parser
+    if not argv:
+        sys.stdout.write(SHORT_USAGE)
+        return 1
+    if argv in (["--version"], ["-V"]):
+        sys.stdout.write(f"persian-transcriber {_package_version()}\n")
+        return 0
+
+    # A file literally named "serve" is still transcribed
+    if argv and argv[0] == "serve" and not Path(argv[0]).exists():
+        return serve_main(argv[1:])
+
     parser = create_parser()
     args = parser.parse_args(argv)
 
@@ -254,39 +521,33 @@ def main(argv: Optional[List[str]] = None) -> int:
         # Validate input
         input_path = validate_input(args.input)
 
-        # Build configuration
-        config = TranscriberConfig(
-            language=args.language,
-            engine=EngineConfig(
-                type=args.engine,
-                model_size=args.model,
-                device=args.device,
-                compute_type=args.compute_type,
-            ),
-            output=OutputConfig(
-                format=args.format,
-                directory=Path(args.output_dir) if args.output_dir else None,
-                include_timestamps=args.timestamps,
-            ),
-            openai_api_key=args.api_key,
-            verbose=args.verbose,
-        )
-
-        # Disable normalization if requested
-        if args.no_normalize:
-            config.normalizer.enabled = False
+        config = build_config(args)
 
         # Create transcriber
+        from .transcriber import PersianAudioTranscriber
+
         transcriber = PersianAudioTranscriber(config=config)
 
         # Process
         if input_path.is_file():
-            # Single file
-            result = transcriber.transcribe_file(
-                input_path,
-                output_path=args.output,
-                save_output=not args.no_save,
-            )
+            # Single file, served by a running 'serve' process when possible
+            result = None
+            if not args.no_server:
+                from .server import request_transcription
+
+                result = request_transcription(
+                    input_path,
+                    config,
+                    output_path=args.output,
+                    save_output=not args.no_save,
+                )
+
+            if result is None:
+                result = transcriber.transcribe_file(
+                    input_path,
+                    output_path=args.output,
+                    save_output=not args.no_save,
+                )
 
             if args.no_save:
                 # Print result to stdout
@@ -300,24 +561,34 @@ def main(argv: Optional[List[str]] = None) -> int:
             # Directory (batch)
             skip_existing = not args.no_skip
 
-            results = transcriber.scan_and_transcribe(
-                input_path,
-                recursive=args.recursive,
-                skip_existing=skip_existing,
-                output_directory=args.output_dir,
-                progress_callback=None if args.quiet else print_progress,
-            )
-
-            # Summary
-            successful = sum(1 for r in results if "error" not in r)
-            print(f"\n✓ Batch processing complete")
-            print(f"  Successful: {successful}/{len(results)}")
-
-            if successful < len(results):
-                failed = [r for r in results if "error" in r]
-                print(f"  Failed files:")
-                for r in failed:
-                    print(f"    - {r.get('file', 'Unknown')}: {r.get('error', 'Unknown error')}")
+            progress, flush_progress = make_progress_printer()
+            try:
+                results = transcriber.scan_and_transcribe(
+                    input_path,
+                    recursive=args.recursive,
+                    skip_existing=skip_existing,
+                    output_directory=args.output_dir,
+                    progress_callback=None if args.quiet else progress,
+                )
+            finally:
+                flush_progress()
+
+            # Summary, written in one go
+            failed = [r for r in results if "error" in r]
+            successful = len(results) - len(failed)
+            summary = [
+                "\n✓ Batch processing complete",
+                f"  Successful: {successful}/{len(results)}",
+            ]
+
+            if failed:
+                summary.append("  Failed files:")
+                summary.extend(
+                    f"    - {r.get('file', 'Unknown')}: {r.get('error', 'Unknown error')}"
+                    for r in failed
+                )
+
+            sys.stdout.write("\n".join(summary) + "\n")
 
         return 0
 
@@ -325,7 +596,7 @@ def main(argv: Optional[List[str]] = None) -> int:
         logger.error(str(e))
         return 1
 
-    except ValueError as e:
+    except (ValueError, ConfigurationError) as e:
         logger.error(str(e))
         return 1
 
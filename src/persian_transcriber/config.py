@@ -35,15 +35,34 @@ class EngineConfig:
 
     Attributes:
         type: Type of engine to use.
-        model_size: Model size for Whisper-based engines.
+        model_size: Model size for Whisper-based engines (e.g. "medium", "large-v3",
+            or "large-v3-turbo" for large-v3 quality with a much faster decoder).
         device: Computation device (auto, cuda, cpu, mps).
-        compute_type: Precision type (float16, int8, float32).
+        compute_type: Precision type (auto, auto_accurate, float16, int8_float16, int8,
+            bfloat16, float32). "auto" picks the narrowest type the device supports;
+            "auto_accurate" skips int8 and picks bfloat16 on AVX512_BF16 CPUs.
+        num_workers: Concurrent transcriptions served by one Faster-Whisper model.
+        cpu_threads: CPU threads per worker for Faster-Whisper.
+        device_index: GPU index, or list of indices for multi-GPU workers.
+        vad_filter: Strip silence with Silero VAD before Faster-Whisper inference.
+        batch_size: Chunks per encoder pass for batched Faster-Whisper (0 disables).
+        encoder_onnx: Encoder ONNX export used by the whisper_trt engine. For that
+            engine compute_type selects the TensorRT precision ("fp16" or "int8").
+        use_cuda_graphs: Capture the openai-whisper decoder step in a CUDA graph and
+            replay it per token (whisper engine on CUDA only).
     """
 
     type: Union[str, EngineType] = EngineType.FASTER_WHISPER
     model_size: str = "medium"
     device: Union[str, DeviceType] = DeviceType.AUTO
     compute_type: Optional[str] = None
+    num_workers: int = 1
+    cpu_threads: int = 4
+    device_index: Union[int, List[int]] = 0
+    vad_filter: bool = True
+    batch_size: int = 0
+    encoder_onnx: Optional[str] = None
+    use_cuda_graphs: bool = False
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -52,6 +71,13 @@ class EngineConfig:
             "model_size": self.model_size,
             "device": str(self.device),
             "compute_type": self.compute_type,
+            "num_workers": self.num_workers,
+            "cpu_threads": self.cpu_threads,
+            "device_index": self.device_index,
+            "vad_filter": self.vad_filter,
+            "batch_size": self.batch_size,
+            "encoder_onnx": self.encoder_onnx,
+            "use_cuda_graphs": self.use_cuda_graphs,
         }
 
 
@@ -170,6 +196,13 @@ class TranscriberConfig:
                 model_size=engine_data.get("model_size", "medium"),
                 device=engine_data.get("device", DeviceType.AUTO),
                 compute_type=engine_data.get("compute_type"),
+                num_workers=engine_data.get("num_workers", 1),
+                cpu_threads=engine_data.get("cpu_threads", 4),
+                device_index=engine_data.get("device_index", 0),
+                vad_filter=engine_data.get("vad_filter", True),
+                batch_size=engine_data.get("batch_size", 0),
+                encoder_onnx=engine_data.get("encoder_onnx"),
+                use_cuda_graphs=engine_data.get("use_cuda_graphs", False),
             )
 
         if "normalizer" in data:
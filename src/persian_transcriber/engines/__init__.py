@@ -5,6 +5,7 @@ This package provides multiple transcription engine implementations:
 
 - WhisperEngine: Original OpenAI Whisper implementation
 - FasterWhisperEngine: Optimized CTranslate2 implementation (recommended)
+- WhisperTRTEngine: TensorRT encoder with CTranslate2 decoding
 - OpenAIAPIEngine: Cloud-based OpenAI Whisper API
 - GoogleEngine: Google Speech Recognition
 
@@ -16,7 +17,8 @@ Example:
     >>> print(result.text)
 """
 
-from typing import Any, Optional, Union
+import importlib
+from typing import TYPE_CHECKING, Any, List, Optional, Union
 
 from .base import (
     BaseEngine,
@@ -24,10 +26,23 @@ from .base import (
     TranscriptionResult,
     TranscriptionSegment,
 )
-from .faster_whisper_engine import FasterWhisperEngine
-from .google_engine import GoogleEngine
-from .openai_api_engine import OpenAIAPIEngine
-from .whisper_engine import WhisperEngine
+
+if TYPE_CHECKING:
+    from .faster_whisper_engine import FasterWhisperEngine
+    from .google_engine import GoogleEngine
+    from .openai_api_engine import OpenAIAPIEngine
+    from .whisper_engine import WhisperEngine
+    from .whisper_trt_engine import WhisperTRTEngine
+
+# Engine classes are imported on first use (PEP 562) so that selecting one
+# engine never loads the modules of the others
+_ENGINE_MODULES = {
+    "WhisperEngine": ".whisper_engine",
+    "FasterWhisperEngine": ".faster_whisper_engine",
+    "WhisperTRTEngine": ".whisper_trt_engine",
+    "OpenAIAPIEngine": ".openai_api_engine",
+    "GoogleEngine": ".google_engine",
+}
 
 __all__ = [
     # Base classes and types
@@ -38,6 +53,7 @@ __all__ = [
     # Engine implementations
     "WhisperEngine",
     "FasterWhisperEngine",
+    "WhisperTRTEngine",
     "OpenAIAPIEngine",
     "GoogleEngine",
     # Factory function
@@ -45,6 +61,20 @@ __all__ = [
 ]
 
 
+def __getattr__(name: str) -> Any:
+    """Import engine classes lazily on attribute access."""
+    module_name = _ENGINE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    engine_class = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = engine_class
+    return engine_class
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_ENGINE_MODULES))
+
+
 def get_engine(
     engine_type: Union[str, EngineType] = EngineType.FASTER_WHISPER,
     model_size: str = "medium",
@@ -59,6 +89,7 @@ def get_engine(
         engine_type: Type of engine to create. Options:
             - "whisper" or EngineType.WHISPER: Original OpenAI Whisper
             - "faster_whisper" or EngineType.FASTER_WHISPER: Faster-Whisper (recommended)
+            - "whisper_trt" or EngineType.WHISPER_TRT: TensorRT encoder (CUDA only)
             - "openai_api" or EngineType.OPENAI_API: OpenAI cloud API
             - "google" or EngineType.GOOGLE: Google Speech Recognition
         model_size: Model size for Whisper engines (e.g., "tiny", "base", "small",
@@ -94,6 +125,8 @@ def get_engine(
 
     # Create appropriate engine
     if engine_type in (EngineType.WHISPER, "whisper"):
+        from .whisper_engine import WhisperEngine
+
         return WhisperEngine(
             model_size=model_size,
             device=device,
@@ -101,19 +134,33 @@ def get_engine(
         )
 
     if engine_type in (EngineType.FASTER_WHISPER, "faster_whisper"):
+        from .faster_whisper_engine import FasterWhisperEngine
+
         return FasterWhisperEngine(
             model_size=model_size,
             device=device,
             **kwargs,
         )
 
+    if engine_type in (EngineType.WHISPER_TRT, "whisper_trt"):
+        from .whisper_trt_engine import WhisperTRTEngine
+
+        return WhisperTRTEngine(
+            model_size=model_size,
+            **kwargs,
+        )
+
     if engine_type in (EngineType.OPENAI_API, "openai_api"):
+        from .openai_api_engine import OpenAIAPIEngine
+
         return OpenAIAPIEngine(
             api_key=api_key,
             **kwargs,
         )
 
     if engine_type in (EngineType.GOOGLE, "google"):
+        from .google_engine import GoogleEngine
+
         return GoogleEngine(
             api_key=api_key,
             **kwargs,
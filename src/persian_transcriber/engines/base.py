@@ -16,6 +16,7 @@ class EngineType(str, Enum):
 
     WHISPER = "whisper"
     FASTER_WHISPER = "faster_whisper"
+    WHISPER_TRT = "whisper_trt"
     OPENAI_API = "openai_api"
     GOOGLE = "google"
 
@@ -117,6 +118,36 @@ class TranscriptionResult:
             "metadata": self.metadata,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TranscriptionResult":
+        """
+        Create a result from a dictionary.
+
+        Accepts both ``to_dict()`` output and the dictionary returned by
+        ``PersianAudioTranscriber.transcribe_file()``, so a single
+        transcription can be written out by several formatters.
+        """
+        return cls(
+            text=data.get("text", ""),
+            text_raw=data.get("text_raw", ""),
+            segments=[
+                TranscriptionSegment(
+                    text=seg.get("text", ""),
+                    start=seg.get("start", 0.0),
+                    end=seg.get("end", 0.0),
+                    confidence=seg.get("confidence"),
+                    words=seg.get("words"),
+                )
+                for seg in data.get("segments", [])
+            ],
+            language=data.get("language", "fa"),
+            language_probability=data.get("language_probability"),
+            duration=data.get("duration", 0.0),
+            engine=data.get("engine", ""),
+            model=data.get("model", ""),
+            metadata=data.get("metadata", {}),
+        )
+
 
 class BaseEngine(ABC):
     """
@@ -0,0 +1,233 @@
+"""
+CUDA-graph decoder for the OpenAI Whisper engine.
+
+Autoregressive decoding launches dozens of small kernels per token, so on a
+GPU it is bound by CPU launch overhead rather than compute. This module runs
+the openai-whisper text decoder one token at a time against a statically
+allocated KV cache, which lets a single decoder step be captured once with
+``torch.cuda.graph`` and replayed for every following token.
+
+CTranslate2 (faster-whisper) does not expose graph capture, so this is only
+used by :class:`~persian_transcriber.engines.whisper_engine.WhisperEngine`.
+"""
+
+import contextlib
+import logging
+import threading
+from typing import Any, Dict, Iterator, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Warm-up iterations run on a side stream before capture
+_WARMUP_STEPS = 3
+
+
+class _StaticStep:
+    """
+    One captured decoder step for a fixed batch size and dtype.
+
+    All tensors touched by the graph are allocated here and only ever
+    updated in place, so their device addresses stay valid across replays.
+    """
+
+    def __init__(self, model: Any, batch_size: int, dtype: Any) -> None:
+        import torch
+
+        decoder = model.decoder
+        dims = model.dims
+        device = decoder.token_embedding.weight.device
+
+        self.model = model
+        self.batch_size = batch_size
+        self.max_len = dims.n_text_ctx
+        self.n_head = dims.n_text_head
+
+        n_layer = len(decoder.blocks)
+        n_state = dims.n_text_state
+
+        # Zero-filled so masked-out cache positions never produce NaNs
+        self.self_k = torch.zeros(
+            n_layer, batch_size, self.max_len, n_state, dtype=dtype, device=device
+        )
+        self.self_v = torch.zeros_like(self.self_k)
+        self.cross_k = torch.zeros(
+            n_layer, batch_size, dims.n_audio_ctx, n_state, dtype=dtype, device=device
+        )
+        self.cross_v = torch.zeros_like(self.cross_k)
+
+        self.tokens = torch.zeros(batch_size, 1, dtype=torch.long, device=device)
+        self.cur_pos = torch.zeros(1, dtype=torch.long, device=device)
+        self._positions = torch.arange(self.max_len, device=device)
+
+        self.graph = torch.cuda.CUDAGraph()
+        self.logits = self._capture()
+
+    def _attend(self, q: Any, k: Any, v: Any, mask: Any = None) -> Any:
+        """Multi-head attention over (batch, ctx, state) tensors."""
+        import torch
+
+        n_batch, n_q, n_state = q.shape
+        head_dim = n_state // self.n_head
+        q = q.view(n_batch, n_q, self.n_head, head_dim).transpose(1, 2)
+        k = k.view(n_batch, k.shape[1], self.n_head, head_dim).transpose(1, 2)
+        v = v.view(n_batch, v.shape[1], self.n_head, head_dim).transpose(1, 2)
+
+        scores = (q @ k.transpose(-1, -2)).float() * head_dim**-0.5
+        if mask is not None:
+            scores = scores.masked_fill(~mask, float("-inf"))
+        weights = torch.softmax(scores, dim=-1).to(q.dtype)
+
+        return (weights @ v).transpose(1, 2).reshape(n_batch, n_q, n_state)
+
+    def _step(self) -> Any:
+        """Decode ``self.tokens`` at position ``self.cur_pos`` and return logits."""
+        decoder = self.model.decoder
+        dtype = self.self_k.dtype
+
+        x = decoder.token_embedding(self.tokens)
+        x = x + decoder.positional_embedding.index_select(0, self.cur_pos)
+        x = x.to(dtype)
+
+        # Only cache slots up to and including the current position are valid
+        mask = (self._positions <= self.cur_pos).view(1, 1, 1, self.max_len)
+
+        for layer, block in enumerate(decoder.blocks):
+            h = block.attn_ln(x)
+            self.self_k[layer].index_copy_(1, self.cur_pos, block.attn.key(h))
+            self.self_v[layer].index_copy_(1, self.cur_pos, block.attn.value(h))
+            attn = self._attend(block.attn.query(h), self.self_k[layer], self.self_v[layer], mask)
+            x = x + block.attn.out(attn)
+
+            h = block.cross_attn_ln(x)
+            attn = self._attend(block.cross_attn.query(h), self.cross_k[layer], self.cross_v[layer])
+            x = x + block.cross_attn.out(attn)
+
+            x = x + block.mlp(block.mlp_ln(x))
+
+        x = decoder.ln(x)
+        return (x @ decoder.token_embedding.weight.to(x.dtype).transpose(0, 1)).float()
+
+    def _capture(self) -> Any:
+        """Warm up on a side stream, then capture one step into ``self.graph``."""
+        import torch
+
+        stream = torch.cuda.Stream()
+        stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(stream):
+            for _ in range(_WARMUP_STEPS):
+                self._step()
+        torch.cuda.current_stream().wait_stream(stream)
+
+        with torch.cuda.graph(self.graph):
+            logits = self._step()
+        return logits
+
+    def set_audio_features(self, audio_features: Any) -> None:
+        """Precompute cross-attention keys and values for a new batch of audio."""
+        for layer, block in enumerate(self.model.decoder.blocks):
+            self.cross_k[layer].copy_(block.cross_attn.key(audio_features))
+            self.cross_v[layer].copy_(block.cross_attn.value(audio_features))
+
+    def run(self, tokens: Any, position: int) -> Any:
+        """Replay the graph for one token column at the given position."""
+        self.tokens.copy_(tokens)
+        self.cur_pos.fill_(position)
+        self.graph.replay()
+        return self.logits.clone()
+
+    def reorder(self, source_indices: List[int]) -> None:
+        """Reorder the self-attention cache along the batch axis (beam search)."""
+        import torch
+
+        index = torch.tensor(source_indices, device=self.self_k.device)
+        self.self_k.copy_(self.self_k.index_select(1, index))
+        self.self_v.copy_(self.self_v.index_select(1, index))
+
+
+class CUDAGraphDecoder:
+    """
+    Captured decoder steps for an openai-whisper model.
+
+    Graphs are captured lazily, one per (batch size, dtype) combination seen
+    during decoding, and reused for every later segment.
+
+    Example:
+        >>> decoder = CUDAGraphDecoder(model)
+        >>> with decoder.patch_decoding():
+        ...     result = model.transcribe("audio.mp3", language="fa")
+    """
+
+    def __init__(self, model: Any) -> None:
+        """
+        Initialize the graph decoder.
+
+        Args:
+            model: A loaded ``whisper.model.Whisper`` instance on a CUDA device.
+        """
+        self.model = model
+        self._steps: Dict[Tuple[int, Any], _StaticStep] = {}
+        self._lock = threading.Lock()
+
+    def get_step(self, batch_size: int, dtype: Any) -> _StaticStep:
+        """Get (capturing on first use) the graph for a batch size and dtype."""
+        key = (batch_size, dtype)
+        step = self._steps.get(key)
+        if step is None:
+            logger.debug(f"Capturing CUDA graph for decoder step (batch={batch_size}, {dtype})")
+            step = _StaticStep(self.model, batch_size, dtype)
+            self._steps[key] = step
+        return step
+
+    @contextlib.contextmanager
+    def patch_decoding(self) -> Iterator[None]:
+        """
+        Route openai-whisper's decoding loop through the captured graphs.
+
+        ``whisper.decoding.DecodingTask`` builds its inference backend from the
+        module-level ``PyTorchInference`` name, so it is swapped for the
+        duration of the block. The lock keeps concurrent callers from sharing
+        the static buffers.
+        """
+        import whisper.decoding as decoding
+
+        graph_decoder = self
+
+        class _GraphInference(decoding.Inference):
+            def __init__(self, model: Any, initial_token_length: int) -> None:
+                self._step: Any = None
+                self._position = 0
+
+            def logits(self, tokens: Any, audio_features: Any) -> Any:
+                import torch
+
+                if self._step is None:
+                    self._step = graph_decoder.get_step(tokens.shape[0], audio_features.dtype)
+                    self._step.set_audio_features(audio_features)
+
+                if tokens.shape[1] > self._step.max_len:
+                    raise ValueError(
+                        f"Token sequence exceeds decoder context ({self._step.max_len})"
+                    )
+
+                # Feed every token not yet in the cache; the first call prefills the prompt
+                outputs = []
+                for position in range(self._position, tokens.shape[1]):
+                    outputs.append(self._step.run(tokens[:, position : position + 1], position))
+                self._position = tokens.shape[1]
+                return torch.cat(outputs, dim=1)
+
+            def rearrange_kv_cache(self, source_indices: List[int]) -> None:
+                if self._step is not None and source_indices != list(range(len(source_indices))):
+                    self._step.reorder(source_indices)
+
+            def cleanup_caching(self) -> None:
+                self._step = None
+                self._position = 0
+
+        with self._lock:
+            original = decoding.PyTorchInference
+            decoding.PyTorchInference = _GraphInference
+            try:
+                yield
+            finally:
+                decoding.PyTorchInference = original
@@ -10,7 +10,12 @@ import re
 from pathlib import Path
 from typing import Any, List, Optional, Union
 
-from ..utils.cuda_setup import get_best_device, get_compute_type, setup_cuda_paths
+from ..utils.cuda_setup import (
+    detect_compute_type,
+    get_best_device,
+    get_compute_type,
+    setup_cuda_paths,
+)
 from ..utils.exceptions import EngineError, ModelLoadError
 from .base import BaseEngine, EngineType, TranscriptionResult, TranscriptionSegment
 
@@ -104,6 +109,8 @@ class FasterWhisperEngine(BaseEngine):
         "large-v2",
         "large-v3",
         "large",
+        "large-v3-turbo",
+        "turbo",
         "distil-large-v2",
         "distil-large-v3",
         "distil-medium.en",
@@ -117,6 +124,8 @@ class FasterWhisperEngine(BaseEngine):
         compute_type: Optional[str] = None,
         cpu_threads: int = 4,
         num_workers: int = 1,
+        device_index: Union[int, List[int]] = 0,
+        batch_size: int = 0,
         download_root: Optional[str] = None,
     ) -> None:
         """
@@ -124,16 +133,34 @@ class FasterWhisperEngine(BaseEngine):
 
         Args:
             model_size: Size of the model to use. Options:
-                       "tiny", "base", "small", "medium", "large-v3", etc.
+                       "tiny", "base", "small", "medium", "large-v3",
+                       "large-v3-turbo", etc.
                        For Persian, "medium" or larger is recommended.
             device: Device to run on ("cuda", "cpu", "auto", or None for auto-detect).
             compute_type: Computation precision type:
+                         - "auto": Narrowest type the device supports (see
+                           detect_compute_type; int8_float16 on SM>=7.5 GPUs)
                          - "float16": Fast GPU inference (recommended for CUDA)
+                         - "int8_float16": int8 weights with FP16 compute,
+                           about half the VRAM of float16 on CUDA
+                         - "auto_accurate": Like "auto" but without int8;
+                           bfloat16 on AVX512_BF16 CPUs and Ampere+ GPUs
                          - "int8": CPU-optimized inference
+                         - "bfloat16": About 2x float32 speed on CPUs with
+                           AVX512_BF16 (Cooper Lake and later Xeons), with
+                           float32's dynamic range
                          - "float32": Full precision
                          If None, automatically selected based on device.
             cpu_threads: Number of CPU threads for inference (when using CPU).
-            num_workers: Number of workers for parallel processing.
+            num_workers: Number of concurrent transcribe() calls the model can
+                        serve from one copy of the weights. CTranslate2 releases
+                        the GIL, so a single engine shared across threads runs
+                        these calls in parallel.
+            device_index: GPU index, or a list of indices to spread workers
+                         across multiple GPUs (e.g. [0, 1, 2, 3]).
+            batch_size: Number of audio chunks decoded per encoder pass using
+                       faster-whisper's BatchedInferencePipeline. Values of 0 or 1
+                       use the sequential decoder.
             download_root: Directory to download/cache models.
         """
         super().__init__()
@@ -142,7 +169,10 @@ class FasterWhisperEngine(BaseEngine):
         self._requested_compute_type = compute_type
         self.cpu_threads = cpu_threads
         self.num_workers = num_workers
+        self.device_index = device_index
+        self.batch_size = batch_size
         self.download_root = download_root
+        self._pipeline: Any = None
 
         # Actual values set during model loading
         self._actual_device: str = "cpu"
@@ -168,6 +198,26 @@ class FasterWhisperEngine(BaseEngine):
         """Get the actual compute type being used."""
         return self._actual_compute_type
 
+    def _get_model_class(self, whisper_model_class: Any) -> Any:
+        """
+        Return the WhisperModel class to instantiate.
+
+        Subclasses can override this to swap parts of the faster-whisper
+        pipeline (e.g. the encoder) while keeping its decoding logic.
+
+        Args:
+            whisper_model_class: faster_whisper.WhisperModel.
+
+        Returns:
+            The class used to construct the model.
+        """
+        return whisper_model_class
+
+    def unload_model(self) -> None:
+        """Unload the model and any batched pipeline wrapping it."""
+        self._pipeline = None
+        super().unload_model()
+
     def load_model(self) -> None:
         """
         Load the Faster-Whisper model.
@@ -194,6 +244,8 @@ class FasterWhisperEngine(BaseEngine):
                 reason="faster-whisper not installed. Run: pip install faster-whisper",
             ) from e
 
+        model_class = self._get_model_class(WhisperModel)
+
         logger.info(f"Loading Faster-Whisper {self.model_size} model...")
 
         # Determine device
@@ -205,14 +257,24 @@ class FasterWhisperEngine(BaseEngine):
         # Determine compute type
         if self._requested_compute_type is None:
             self._actual_compute_type = get_compute_type(self._actual_device)
+        elif self._requested_compute_type in ("auto", "auto_accurate"):
+            first_index = (
+                self.device_index[0] if isinstance(self.device_index, list) else self.device_index
+            )
+            self._actual_compute_type = detect_compute_type(
+                self._actual_device,
+                first_index,
+                prefer_accuracy=self._requested_compute_type == "auto_accurate",
+            )
         else:
             self._actual_compute_type = self._requested_compute_type
 
         # Try to load model with GPU first, fallback to CPU if needed
         try:
-            self._model = WhisperModel(
+            self._model = model_class(
                 self.model_size,
                 device=self._actual_device,
+                device_index=self.device_index,
                 compute_type=self._actual_compute_type,
                 cpu_threads=self.cpu_threads,
                 num_workers=self.num_workers,
@@ -240,7 +302,7 @@ class FasterWhisperEngine(BaseEngine):
                 self._actual_compute_type = "int8"
 
                 try:
-                    self._model = WhisperModel(
+                    self._model = model_class(
                         self.model_size,
                         device=self._actual_device,
                         compute_type=self._actual_compute_type,
@@ -268,9 +330,15 @@ class FasterWhisperEngine(BaseEngine):
                     reason=str(e),
                 ) from e
 
+        if self.batch_size > 1:
+            from faster_whisper import BatchedInferencePipeline
+
+            self._pipeline = BatchedInferencePipeline(model=self._model)
+            logger.info(f"Using batched inference with batch size {self.batch_size}")
+
     def transcribe(
         self,
-        audio_path: str,
+        audio_path: Union[str, Any],
         language: str = "fa",
         task: str = "transcribe",
         beam_size: int = 5,
@@ -295,7 +363,8 @@ class FasterWhisperEngine(BaseEngine):
         Transcribe an audio file using Faster-Whisper.
 
         Args:
-            audio_path: Path to the audio file.
+            audio_path: Path to the audio file, or a mono float32 numpy
+                array sampled at 16 kHz.
             language: Language code (e.g., "fa" for Persian).
             task: Task type - "transcribe" or "translate" (to English).
             beam_size: Beam size for decoding.
@@ -325,14 +394,21 @@ class FasterWhisperEngine(BaseEngine):
         if not self.is_loaded:
             self.load_model()
 
-        _audio_path = Path(audio_path)
-        if not _audio_path.exists():
-            raise EngineError(
-                f"Audio file not found: {_audio_path}",
-                engine_name=self.name,
-            )
+        # Decoded 16 kHz float32 samples are passed through unchanged
+        if isinstance(audio_path, (str, Path)):
+            _audio_path = Path(audio_path)
+            if not _audio_path.exists():
+                raise EngineError(
+                    f"Audio file not found: {_audio_path}",
+                    engine_name=self.name,
+                )
+            audio_input: Any = str(audio_path)
+            source_name = _audio_path.name
+        else:
+            audio_input = audio_path
+            source_name = "audio array"
 
-        logger.info(f"Transcribing with Faster-Whisper: {_audio_path.name}")
+        logger.info(f"Transcribing with Faster-Whisper: {source_name}")
 
         try:
             # Set default VAD parameters if not provided
@@ -346,9 +422,13 @@ class FasterWhisperEngine(BaseEngine):
                 initial_prompt = LANGUAGE_INITIAL_PROMPTS[language]
                 logger.debug(f"Using default initial prompt for {language}: {initial_prompt}")
 
+            # Batched pipeline decodes several chunks per encoder pass
+            backend = self._pipeline if self._pipeline is not None else self._model
+            batch_kwargs = {"batch_size": self.batch_size} if self._pipeline is not None else {}
+
             # Run transcription with anti-repetition settings
-            segments_generator, info = self._model.transcribe(
-                str(audio_path),
+            segments_generator, info = backend.transcribe(
+                audio_input,
                 language=language,
                 task=task,
                 beam_size=beam_size,
@@ -367,6 +447,7 @@ class FasterWhisperEngine(BaseEngine):
                 repetition_penalty=repetition_penalty,
                 no_repeat_ngram_size=no_repeat_ngram_size,
                 hallucination_silence_threshold=hallucination_silence_threshold,
+                **batch_kwargs,
             )
 
             # Collect segments
@@ -430,6 +511,7 @@ class FasterWhisperEngine(BaseEngine):
                     "compute_type": self._actual_compute_type,
                     "task": task,
                     "vad_filter": vad_filter,
+                    "batch_size": self.batch_size,
                     "initial_prompt": initial_prompt,
                 },
             )
@@ -6,10 +6,10 @@ service via the SpeechRecognition library.
 """
 
 import logging
-import tempfile
 from pathlib import Path
 from typing import Any, List, Optional
 
+from ..utils.audio import convert_audio
 from ..utils.exceptions import APIError, EngineError
 from .base import BaseEngine, EngineType, TranscriptionResult, TranscriptionSegment
 
@@ -284,32 +284,10 @@ class GoogleEngine(BaseEngine):
         if path.suffix.lower() == ".wav":
             return audio_path
 
-        # Convert to WAV
+        # Convert to mono, 16kHz WAV for best recognition
         try:
-            from pydub import AudioSegment
-
             logger.debug(f"Converting {path.suffix} to WAV for Google Speech Recognition")
-
-            audio = AudioSegment.from_file(audio_path)
-
-            # Convert to mono, 16kHz for best recognition
-            audio = audio.set_channels(1)
-            audio = audio.set_frame_rate(16000)
-
-            # Save to temporary file
-            temp_file = tempfile.NamedTemporaryFile(
-                suffix=".wav",
-                delete=False,
-            )
-            audio.export(temp_file.name, format="wav")
-
-            return temp_file.name
-
-        except ImportError:
-            logger.warning(
-                "pydub not installed. Audio conversion skipped. " "For best results, use WAV files."
-            )
-            return audio_path
+            return convert_audio(audio_path, output_format="wav", sample_rate=16000, channels=1)
         except Exception as e:
             logger.warning(f"Audio conversion failed: {e}. Using original file.")
             return audio_path
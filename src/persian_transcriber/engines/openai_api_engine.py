@@ -5,6 +5,7 @@ This module provides transcription using the OpenAI Whisper API,
 which runs inference in the cloud rather than locally.
 """
 
+import asyncio
 import logging
 import os
 from pathlib import Path
@@ -42,6 +43,9 @@ class OpenAIAPIEngine(BaseEngine):
     # Supported formats by the API
     SUPPORTED_FORMATS: List[str] = ["mp3", "mp4", "mpeg", "mpga", "m4a", "wav", "webm"]
 
+    # Idle connections kept open by the async client for concurrent uploads
+    MAX_KEEPALIVE_CONNECTIONS: int = 20
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -67,6 +71,8 @@ class OpenAIAPIEngine(BaseEngine):
         self.base_url = base_url
         self.timeout = timeout
         self._client: Any = None
+        self._async_client: Any = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
 
     @property
     def name(self) -> str:
@@ -152,27 +158,70 @@ class OpenAIAPIEngine(BaseEngine):
         if not self.is_loaded:
             self.load_model()
 
-        _audio_path = Path(audio_path)
-        if not _audio_path.exists():
-            raise EngineError(
-                f"Audio file not found: {_audio_path}",
-                engine_name=self.name,
-            )
+        _audio_path = self._check_audio_file(audio_path)
+        logger.info(f"Transcribing with OpenAI API: {_audio_path.name}")
 
-        # Check file size
-        file_size_mb = _audio_path.stat().st_size / (1024 * 1024)
-        if file_size_mb > self.MAX_FILE_SIZE_MB:
+        try:
+            with open(_audio_path, "rb") as audio_file:
+                response = self._client.audio.transcriptions.create(
+                    model=self.model,
+                    file=audio_file,
+                    language=language,
+                    prompt=prompt,
+                    response_format=response_format,
+                    temperature=temperature,
+                )
+            return self._build_result(response, response_format, language)
+
+        except Exception as e:
+            self._handle_api_error(e)
             raise EngineError(
-                f"File too large ({file_size_mb:.1f} MB). "
-                f"Maximum size is {self.MAX_FILE_SIZE_MB} MB.",
+                f"Transcription failed: {e}",
                 engine_name=self.name,
-            )
+            ) from e
 
+    async def transcribe_async(
+        self,
+        audio_path: str,
+        language: str = "fa",
+        prompt: Optional[str] = None,
+        response_format: str = "verbose_json",
+        temperature: float = 0.0,
+        **kwargs: Any,
+    ) -> TranscriptionResult:
+        """
+        Transcribe an audio file without blocking the event loop.
+
+        All calls made from one event loop share a single AsyncOpenAI client,
+        so concurrent uploads (e.g. under asyncio.gather) reuse pooled
+        TCP/TLS connections, multiplexed over HTTP/2 if ``h2`` is installed.
+
+        Args:
+            audio_path: Path to the audio file.
+            language: Language code (e.g., "fa" for Persian).
+            prompt: Optional prompt to guide the transcription.
+            response_format: Response format - "json", "text", "srt", "verbose_json", "vtt".
+            temperature: Sampling temperature (0-1).
+            **kwargs: Additional arguments passed to the API.
+
+        Returns:
+            TranscriptionResult: Transcription result with text and segments.
+
+        Raises:
+            EngineError: If transcription fails.
+            APIError: If the API returns an error.
+            RateLimitError: If rate limit is exceeded.
+        """
+        if not self.is_loaded:
+            self.load_model()
+
+        _audio_path = self._check_audio_file(audio_path)
+        client = self._get_async_client()
         logger.info(f"Transcribing with OpenAI API: {_audio_path.name}")
 
         try:
             with open(_audio_path, "rb") as audio_file:
-                response = self._client.audio.transcriptions.create(
+                response = await client.audio.transcriptions.create(
                     model=self.model,
                     file=audio_file,
                     language=language,
@@ -180,32 +229,7 @@ class OpenAIAPIEngine(BaseEngine):
                     response_format=response_format,
                     temperature=temperature,
                 )
-
-            # Parse response based on format
-            if response_format == "verbose_json":
-                text = response.text
-                segments = self._parse_segments(response)
-                duration = response.duration if hasattr(response, "duration") else 0.0
-                detected_language = response.language if hasattr(response, "language") else language
-            else:
-                text = response if isinstance(response, str) else str(response)
-                segments = []
-                duration = 0.0
-                detected_language = language
-
-            return TranscriptionResult(
-                text=text,
-                text_raw=text,
-                segments=segments,
-                language=detected_language,
-                duration=duration,
-                engine=self.name,
-                model=self.model,
-                metadata={
-                    "response_format": response_format,
-                    "api_model": self.model,
-                },
-            )
+            return self._build_result(response, response_format, language)
 
         except Exception as e:
             self._handle_api_error(e)
@@ -214,6 +238,118 @@ class OpenAIAPIEngine(BaseEngine):
                 engine_name=self.name,
             ) from e
 
+    def _get_async_client(self) -> Any:
+        """
+        Get the AsyncOpenAI client for the running event loop.
+
+        httpx connections are bound to the loop that opened them, so a new
+        client is created when called from a different loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is not None and self._async_loop is loop:
+            return self._async_client
+
+        import httpx
+        from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+        limits = httpx.Limits(
+            max_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+            max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+        )
+        try:
+            http_client = DefaultAsyncHttpxClient(http2=True, limits=limits)
+        except ImportError:
+            logger.debug("h2 not installed, using HTTP/1.1 keep-alive connections")
+            http_client = DefaultAsyncHttpxClient(limits=limits)
+
+        self._async_client = AsyncOpenAI(
+            api_key=self.api_key,
+            organization=self.organization,
+            base_url=self.base_url,
+            timeout=self.timeout,
+            http_client=http_client,
+        )
+        self._async_loop = loop
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """Close the async client's pooled connections."""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+            self._async_loop = None
+
+    def _check_audio_file(self, audio_path: str) -> Path:
+        """
+        Check that an audio file exists and is within the API size limit.
+
+        Args:
+            audio_path: Path to the audio file.
+
+        Returns:
+            Path: The audio file path.
+
+        Raises:
+            EngineError: If the file is missing or too large.
+        """
+        _audio_path = Path(audio_path)
+        if not _audio_path.exists():
+            raise EngineError(
+                f"Audio file not found: {_audio_path}",
+                engine_name=self.name,
+            )
+
+        # Check file size
+        file_size_mb = _audio_path.stat().st_size / (1024 * 1024)
+        if file_size_mb > self.MAX_FILE_SIZE_MB:
+            raise EngineError(
+                f"File too large ({file_size_mb:.1f} MB). "
+                f"Maximum size is {self.MAX_FILE_SIZE_MB} MB.",
+                engine_name=self.name,
+            )
+
+        return _audio_path
+
+    def _build_result(
+        self, response: Any, response_format: str, language: str
+    ) -> TranscriptionResult:
+        """
+        Convert a transcription API response into a TranscriptionResult.
+
+        Args:
+            response: API response object.
+            response_format: Format the response was requested in.
+            language: Requested language code.
+
+        Returns:
+            TranscriptionResult: Parsed result.
+        """
+        # Parse response based on format
+        if response_format == "verbose_json":
+            text = response.text
+            segments = self._parse_segments(response)
+            duration = response.duration if hasattr(response, "duration") else 0.0
+            detected_language = response.language if hasattr(response, "language") else language
+        else:
+            text = response if isinstance(response, str) else str(response)
+            segments = []
+            duration = 0.0
+            detected_language = language
+
+        return TranscriptionResult(
+            text=text,
+            text_raw=text,
+            segments=segments,
+            language=detected_language,
+            duration=duration,
+            engine=self.name,
+            model=self.model,
+            metadata={
+                "response_format": response_format,
+                "api_model": self.model,
+            },
+        )
+
     def _parse_segments(self, response: Any) -> List[TranscriptionSegment]:
         """
         Parse segments from verbose_json response.
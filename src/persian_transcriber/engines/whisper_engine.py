@@ -5,9 +5,10 @@ This module provides the original OpenAI Whisper implementation
 for audio transcription.
 """
 
+import contextlib
 import logging
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Union
 
 from ..utils.exceptions import EngineError, ModelLoadError
 from .base import BaseEngine, EngineType, TranscriptionResult, TranscriptionSegment
@@ -47,6 +48,7 @@ class WhisperEngine(BaseEngine):
         "large-v1",
         "large-v2",
         "large-v3",
+        "large-v3-turbo",
         "turbo",
     ]
 
@@ -55,6 +57,7 @@ class WhisperEngine(BaseEngine):
         model_size: str = "medium",
         device: Optional[str] = None,
         download_root: Optional[str] = None,
+        use_cuda_graphs: bool = False,
     ) -> None:
         """
         Initialize the Whisper engine.
@@ -65,12 +68,16 @@ class WhisperEngine(BaseEngine):
                        For Persian, "medium" or larger is recommended.
             device: Device to run on ("cuda", "cpu", or None for auto-detect).
             download_root: Directory to download/cache models. Uses default if None.
+            use_cuda_graphs: Replay the decoder step from a captured CUDA graph
+                           instead of launching its kernels per token. CUDA only.
         """
         super().__init__()
         self.model_size = model_size
         self.device = device
         self.download_root = download_root
+        self.use_cuda_graphs = use_cuda_graphs
         self._actual_device: str = "cpu"
+        self._graph_decoder: Optional[Any] = None
 
     @property
     def name(self) -> str:
@@ -82,6 +89,11 @@ class WhisperEngine(BaseEngine):
         """Get the engine type."""
         return EngineType.WHISPER
 
+    def unload_model(self) -> None:
+        """Unload the model and release any captured decoder graphs."""
+        self._graph_decoder = None
+        super().unload_model()
+
     def load_model(self) -> None:
         """
         Load the Whisper model.
@@ -126,6 +138,14 @@ class WhisperEngine(BaseEngine):
 
             logger.info(f"Whisper {self.model_size} model loaded on {self._actual_device}")
 
+            if self.use_cuda_graphs:
+                if self._actual_device.startswith("cuda"):
+                    from .cuda_graph_decoder import CUDAGraphDecoder
+
+                    self._graph_decoder = CUDAGraphDecoder(self._model)
+                else:
+                    logger.warning("CUDA graphs require a CUDA device; using eager decoding")
+
         except Exception as e:
             raise ModelLoadError(
                 self.model_size,
@@ -135,7 +155,7 @@ class WhisperEngine(BaseEngine):
 
     def transcribe(
         self,
-        audio_path: str,
+        audio_path: Union[str, Any],
         language: str = "fa",
         task: str = "transcribe",
         verbose: bool = False,
@@ -146,7 +166,8 @@ class WhisperEngine(BaseEngine):
         Transcribe an audio file using Whisper.
 
         Args:
-            audio_path: Path to the audio file.
+            audio_path: Path to the audio file, or a mono float32 numpy
+                array sampled at 16 kHz.
             language: Language code (e.g., "fa" for Persian).
             task: Task type - "transcribe" or "translate" (to English).
             verbose: Whether to print progress during transcription.
@@ -162,24 +183,37 @@ class WhisperEngine(BaseEngine):
         if not self.is_loaded:
             self.load_model()
 
-        _audio_path = Path(audio_path)
-        if not _audio_path.exists():
-            raise EngineError(
-                f"Audio file not found: {_audio_path}",
-                engine_name=self.name,
-            )
+        # Decoded 16 kHz float32 samples are passed through unchanged
+        if isinstance(audio_path, (str, Path)):
+            _audio_path = Path(audio_path)
+            if not _audio_path.exists():
+                raise EngineError(
+                    f"Audio file not found: {_audio_path}",
+                    engine_name=self.name,
+                )
+            audio_input: Any = str(audio_path)
+            source_name = _audio_path.name
+        else:
+            audio_input = audio_path
+            source_name = "audio array"
 
-        logger.info(f"Transcribing with Whisper: {_audio_path.name}")
+        logger.info(f"Transcribing with Whisper: {source_name}")
 
         try:
-            result = self._model.transcribe(
-                str(audio_path),
-                language=language,
-                task=task,
-                verbose=verbose,
-                temperature=temperature,
-                **kwargs,
+            decoding = (
+                self._graph_decoder.patch_decoding()
+                if self._graph_decoder is not None
+                else contextlib.nullcontext()
             )
+            with decoding:
+                result = self._model.transcribe(
+                    audio_input,
+                    language=language,
+                    task=task,
+                    verbose=verbose,
+                    temperature=temperature,
+                    **kwargs,
+                )
 
             # Convert segments
             segments: List[TranscriptionSegment] = []
@@ -209,6 +243,7 @@ class WhisperEngine(BaseEngine):
                 metadata={
                     "device": self._actual_device,
                     "task": task,
+                    "cuda_graphs": self._graph_decoder is not None,
                 },
             )
 
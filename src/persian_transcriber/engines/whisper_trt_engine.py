@@ -0,0 +1,402 @@
+"""
+TensorRT-accelerated Whisper transcription engine.
+
+This module runs the Whisper encoder as a TensorRT engine built from an
+ONNX export, while decoding (tokenizer, beam search, timestamps, VAD)
+is still handled by Faster-Whisper / CTranslate2.
+"""
+
+import logging
+import re
+import shutil
+import subprocess
+import threading
+from pathlib import Path
+from typing import Any, List, Optional, Union
+
+from ..utils.exceptions import ModelLoadError
+from .base import EngineType
+from .faster_whisper_engine import FasterWhisperEngine
+
+logger = logging.getLogger(__name__)
+
+
+# Default directory for serialized TensorRT engines
+DEFAULT_ENGINE_CACHE_DIR = Path.home() / ".cache" / "persian_transcriber" / "trt"
+
+# Whisper processes audio in 30s windows: 3000 mel frames
+CHUNK_FRAMES = 3000
+
+# TensorRT precisions accepted as compute_type
+TRT_PRECISIONS = ("fp16", "int8")
+
+
+def _num_mel_bins(model_size: str) -> int:
+    """Return the number of mel bins used by a Whisper model size."""
+    return 128 if "large-v3" in model_size or model_size == "turbo" else 80
+
+
+def build_trt_encoder(
+    onnx_path: str,
+    engine_path: str,
+    precision: str = "fp16",
+    n_mels: int = 80,
+    max_batch_size: int = 8,
+    input_name: str = "input_features",
+) -> Path:
+    """
+    Build a TensorRT engine for the Whisper encoder.
+
+    Uses ``trtexec`` when it is on PATH and falls back to the
+    ``tensorrt.Builder`` Python API otherwise.
+
+    Args:
+        onnx_path: Path to the encoder ONNX export (e.g. ``encoder_model.onnx``
+                   from ``optimum-cli export onnx --model openai/whisper-large-v3``).
+        engine_path: Where to write the serialized engine.
+        precision: "fp16" or "int8". INT8 expects a Q/DQ-quantized ONNX export.
+        n_mels: Number of mel bins of the model (80, or 128 for large-v3).
+        max_batch_size: Largest batch the engine's optimization profile accepts.
+        input_name: Name of the encoder input tensor in the ONNX graph.
+
+    Returns:
+        Path: Path to the serialized engine.
+
+    Raises:
+        ModelLoadError: If the engine cannot be built.
+    """
+    if precision not in TRT_PRECISIONS:
+        raise ValueError(
+            f"Unsupported TensorRT precision: {precision}. Use one of {TRT_PRECISIONS}"
+        )
+
+    _engine_path = Path(engine_path)
+    _engine_path.parent.mkdir(parents=True, exist_ok=True)
+
+    min_shape = (1, n_mels, CHUNK_FRAMES)
+    max_shape = (max_batch_size, n_mels, CHUNK_FRAMES)
+
+    logger.info(f"Building TensorRT {precision} encoder engine: {_engine_path.name}")
+
+    trtexec = shutil.which("trtexec")
+    if trtexec is not None:
+        min_str = "x".join(str(d) for d in min_shape)
+        max_str = "x".join(str(d) for d in max_shape)
+        cmd = [
+            trtexec,
+            f"--onnx={onnx_path}",
+            f"--saveEngine={_engine_path}",
+            f"--minShapes={input_name}:{min_str}",
+            f"--optShapes={input_name}:{max_str}",
+            f"--maxShapes={input_name}:{max_str}",
+            "--fp16",
+        ]
+        if precision == "int8":
+            cmd.append("--int8")
+
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise ModelLoadError(
+                str(onnx_path),
+                engine_name="Whisper-TRT",
+                reason=f"trtexec failed: {result.stderr.strip()[-500:]}",
+            )
+        return _engine_path
+
+    try:
+        import tensorrt as trt
+    except ImportError as e:
+        raise ModelLoadError(
+            str(onnx_path),
+            engine_name="Whisper-TRT",
+            reason="TensorRT not installed. Run: pip install tensorrt",
+        ) from e
+
+    trt_logger = trt.Logger(trt.Logger.WARNING)
+    builder = trt.Builder(trt_logger)
+    network = builder.create_network(1 << int(trt.NetworkDefinitionCreationFlag.EXPLICIT_BATCH))
+    parser = trt.OnnxParser(network, trt_logger)
+
+    if not parser.parse(Path(onnx_path).read_bytes()):
+        errors = "; ".join(str(parser.get_error(i)) for i in range(parser.num_errors))
+        raise ModelLoadError(str(onnx_path), engine_name="Whisper-TRT", reason=errors)
+
+    config = builder.create_builder_config()
+    config.set_flag(trt.BuilderFlag.FP16)
+    if precision == "int8":
+        config.set_flag(trt.BuilderFlag.INT8)
+
+    profile = builder.create_optimization_profile()
+    profile.set_shape(network.get_input(0).name, min_shape, max_shape, max_shape)
+    config.add_optimization_profile(profile)
+
+    serialized = builder.build_serialized_network(network, config)
+    if serialized is None:
+        raise ModelLoadError(
+            str(onnx_path),
+            engine_name="Whisper-TRT",
+            reason="TensorRT engine build failed",
+        )
+
+    _engine_path.write_bytes(bytes(serialized))
+    return _engine_path
+
+
+class _TRTEncoder:
+    """Callable that runs Whisper mel features through a TensorRT encoder engine."""
+
+    def __init__(self, engine_path: Path, device_index: int = 0) -> None:
+        import tensorrt as trt
+        import torch
+
+        self._trt = trt
+        self._torch = torch
+        self._device = torch.device("cuda", device_index)
+        self._lock = threading.Lock()
+
+        runtime = trt.Runtime(trt.Logger(trt.Logger.WARNING))
+        self._engine = runtime.deserialize_cuda_engine(engine_path.read_bytes())
+        if self._engine is None:
+            raise RuntimeError(f"Failed to deserialize TensorRT engine: {engine_path}")
+        self._context = self._engine.create_execution_context()
+
+        names = [self._engine.get_tensor_name(i) for i in range(self._engine.num_io_tensors)]
+        inputs = [n for n in names if self._engine.get_tensor_mode(n) == trt.TensorIOMode.INPUT]
+        outputs = [n for n in names if n not in inputs]
+        self._input_name = inputs[0]
+        self._output_name = outputs[0]
+
+        # Cast encoder output to the decoder's precision
+        self.half_output = True
+
+    def __call__(self, features: Any) -> Any:
+        """
+        Encode mel features.
+
+        Args:
+            features: numpy array of shape [n_mels, frames] or [batch, n_mels, frames].
+
+        Returns:
+            ctranslate2.StorageView: Encoder output accepted by Whisper.generate().
+        """
+        import ctranslate2
+        import numpy as np
+
+        torch = self._torch
+
+        if features.ndim == 2:
+            features = np.expand_dims(features, 0)
+        features = np.ascontiguousarray(features, dtype=np.float32)
+
+        # One execution context: serialize calls from concurrent workers
+        with self._lock:
+            inp = torch.from_numpy(features).to(self._device)
+            self._context.set_input_shape(self._input_name, tuple(inp.shape))
+            out_shape = tuple(self._context.get_tensor_shape(self._output_name))
+            out = torch.empty(out_shape, dtype=torch.float32, device=self._device)
+
+            self._context.set_tensor_address(self._input_name, inp.data_ptr())
+            self._context.set_tensor_address(self._output_name, out.data_ptr())
+
+            stream = torch.cuda.current_stream(self._device)
+            self._context.execute_async_v3(stream.cuda_stream)
+            stream.synchronize()
+
+        if self.half_output:
+            out = out.half()
+
+        return ctranslate2.StorageView.from_array(out.contiguous())
+
+
+class WhisperTRTEngine(FasterWhisperEngine):
+    """
+    Whisper engine with a TensorRT encoder and CTranslate2 decoder.
+
+    The encoder, which dominates compute for short decodes, runs as a
+    TensorRT engine with fused kernels. The serialized engine is built once
+    per ONNX file, GPU and precision, and cached on disk. Decoding reuses
+    Faster-Whisper's tokenizer, beam search and post-processing, so results
+    have the same shape as FasterWhisperEngine.
+
+    Requires a CUDA GPU, ``tensorrt`` (or ``trtexec``) and ``torch``.
+
+    Example:
+        >>> engine = WhisperTRTEngine(
+        ...     model_size="large-v3",
+        ...     encoder_onnx="whisper-large-v3-onnx/encoder_model.onnx",
+        ...     compute_type="fp16",
+        ... )
+        >>> result = engine.transcribe("audio.mp3", language="fa")
+    """
+
+    def __init__(
+        self,
+        model_size: str = "large-v3",
+        encoder_onnx: Optional[str] = None,
+        compute_type: Optional[str] = None,
+        decoder_compute_type: str = "float16",
+        engine_cache_dir: Optional[str] = None,
+        device_index: Union[int, List[int]] = 0,
+        max_batch_size: int = 8,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Initialize the Whisper-TRT engine.
+
+        Args:
+            model_size: Whisper model size used for the CTranslate2 decoder.
+            encoder_onnx: Path to the encoder ONNX export of the same model.
+            compute_type: TensorRT encoder precision, "fp16" (default) or "int8".
+                         INT8 expects a Q/DQ-quantized ONNX export.
+            decoder_compute_type: CTranslate2 precision for the decoder.
+            engine_cache_dir: Directory for serialized engines
+                             (default: ~/.cache/persian_transcriber/trt).
+            device_index: CUDA device to run on. A single-element list (as
+                         EngineConfig allows) is accepted; the TensorRT
+                         encoder runs on one GPU, so longer lists are rejected.
+            max_batch_size: Largest encoder batch the TensorRT engine accepts.
+            **kwargs: Additional FasterWhisperEngine arguments.
+        """
+        kwargs.pop("device", None)
+        if isinstance(device_index, (list, tuple)):
+            if len(device_index) != 1:
+                raise ValueError(
+                    f"Whisper-TRT runs on a single GPU; got device_index={device_index}"
+                )
+            device_index = device_index[0]
+
+        super().__init__(
+            model_size=model_size,
+            device="cuda",
+            compute_type=decoder_compute_type,
+            device_index=device_index,
+            **kwargs,
+        )
+
+        precision = compute_type or "fp16"
+        if precision == "float16":
+            precision = "fp16"
+        if precision not in TRT_PRECISIONS:
+            raise ValueError(
+                f"Unsupported TensorRT precision: {compute_type}. Use one of {TRT_PRECISIONS}"
+            )
+
+        self.encoder_onnx = encoder_onnx
+        self.trt_precision = precision
+        self.engine_cache_dir = (
+            Path(engine_cache_dir) if engine_cache_dir else DEFAULT_ENGINE_CACHE_DIR
+        )
+        self.max_batch_size = max_batch_size
+        # The validated single GPU; device_index keeps the base class's wider type
+        self._gpu_index: int = device_index
+        self._encoder: Optional[_TRTEncoder] = None
+
+    @property
+    def name(self) -> str:
+        """Get the engine name."""
+        return "Whisper-TRT"
+
+    @property
+    def engine_type(self) -> EngineType:
+        """Get the engine type."""
+        return EngineType.WHISPER_TRT
+
+    def _engine_path(self) -> Path:
+        """Return the cache path of the serialized engine for the current GPU."""
+        import tensorrt as trt
+        import torch
+
+        gpu_name = re.sub(r"[^A-Za-z0-9]+", "-", torch.cuda.get_device_name(self._gpu_index)).strip(
+            "-"
+        )
+        major, minor = torch.cuda.get_device_capability(self._gpu_index)
+        stem = Path(str(self.encoder_onnx)).stem
+        filename = (
+            f"{self.model_size}-{stem}-{gpu_name}-sm{major}{minor}-"
+            f"trt{trt.__version__}-{self.trt_precision}.trt"
+        )
+        return self.engine_cache_dir / filename
+
+    def _get_model_class(self, whisper_model_class: Any) -> Any:
+        """Return a WhisperModel subclass whose encoder runs on TensorRT."""
+        if self._encoder is None:
+            raise ModelLoadError(
+                self.model_size, engine_name=self.name, reason="TensorRT encoder is not loaded"
+            )
+        encoder: _TRTEncoder = self._encoder
+
+        class _TRTWhisperModel(whisper_model_class):
+            def encode(self, features: Any) -> Any:
+                return encoder(features)
+
+        return _TRTWhisperModel
+
+    def load_model(self) -> None:
+        """
+        Build (or load from cache) the TensorRT encoder and the decoder model.
+
+        Raises:
+            ModelLoadError: If TensorRT, torch or the ONNX export is unavailable,
+                           or no CUDA GPU is present.
+        """
+        if self.is_loaded:
+            logger.debug("Whisper-TRT model already loaded")
+            return
+
+        if not self.encoder_onnx or not Path(self.encoder_onnx).exists():
+            raise ModelLoadError(
+                self.model_size,
+                engine_name=self.name,
+                reason=(
+                    "encoder_onnx must point to an ONNX encoder export, e.g. "
+                    "optimum-cli export onnx --model openai/whisper-large-v3 whisper-onnx/"
+                ),
+            )
+
+        try:
+            import tensorrt  # noqa: F401
+            import torch
+        except ImportError as e:
+            raise ModelLoadError(
+                self.model_size,
+                engine_name=self.name,
+                reason="tensorrt and torch are required. Run: pip install tensorrt torch",
+            ) from e
+
+        if not torch.cuda.is_available():
+            raise ModelLoadError(
+                self.model_size,
+                engine_name=self.name,
+                reason="TensorRT requires a CUDA GPU",
+            )
+
+        engine_path = self._engine_path()
+        if engine_path.exists():
+            logger.info(f"Using cached TensorRT engine: {engine_path}")
+        else:
+            build_trt_encoder(
+                str(self.encoder_onnx),
+                str(engine_path),
+                precision=self.trt_precision,
+                n_mels=_num_mel_bins(self.model_size),
+                max_batch_size=self.max_batch_size,
+            )
+
+        self._encoder = _TRTEncoder(engine_path, device_index=self._gpu_index)
+
+        super().load_model()
+
+        if self._actual_device != "cuda":
+            self.unload_model()
+            raise ModelLoadError(
+                self.model_size,
+                engine_name=self.name,
+                reason="CUDA decoder failed to load; TensorRT engine cannot run on CPU",
+            )
+
+        self._encoder.half_output = self._actual_compute_type in ("float16", "int8_float16")
+
+    def unload_model(self) -> None:
+        """Unload the decoder model and release the TensorRT engine."""
+        self._encoder = None
+        super().unload_model()
@@ -24,11 +24,11 @@ Example:
 
 from enum import Enum
 from typing import Any, Union
-from typing import Union
 
+from . import persian as _persian
 from .base import BaseNormalizer
 from .basic import BasicNormalizer
-from .persian import PersianNormalizer, HAZM_AVAILABLE
+from .persian import PersianNormalizer
 
 __all__ = [
     "BaseNormalizer",
@@ -40,6 +40,13 @@ __all__ = [
 ]
 
 
+def __getattr__(name: str) -> Any:
+    """Resolve HAZM_AVAILABLE on first access so Hazm is not imported eagerly."""
+    if name == "HAZM_AVAILABLE":
+        return _persian.HAZM_AVAILABLE
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class NormalizerType(str, Enum):
     """Enumeration of available normalizer types."""
 
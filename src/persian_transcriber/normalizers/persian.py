@@ -13,20 +13,35 @@ from .basic import BasicNormalizer
 
 logger = logging.getLogger(__name__)
 
-# Try to import Hazm
-HAZM_AVAILABLE = False
-_HazmNormalizerClass: Optional[type] = None
+# Hazm pulls in NLTK and friends, so it is only imported when first needed
+_hazm_normalizer_class: Optional[type] = None
+_hazm_checked = False
 
-try:
-    from hazm import Normalizer as _HazmNormalizerImport
 
-    _HazmNormalizerClass = _HazmNormalizerImport
-    HAZM_AVAILABLE = True
-except ImportError:
-    logger.debug("Hazm library not available, will use BasicNormalizer as fallback")
-except Exception as e:
-    # Catch other errors (e.g., fasttext dependency issues on Python 3.13)
-    logger.debug(f"Hazm import failed with error: {e}")
+def _load_hazm() -> Optional[type]:
+    """Import Hazm's Normalizer on first use; returns None if unavailable."""
+    global _hazm_normalizer_class, _hazm_checked
+
+    if not _hazm_checked:
+        _hazm_checked = True
+        try:
+            from hazm import Normalizer as _HazmNormalizerImport
+
+            _hazm_normalizer_class = _HazmNormalizerImport
+        except ImportError:
+            logger.debug("Hazm library not available, will use BasicNormalizer as fallback")
+        except Exception as e:
+            # Catch other errors (e.g., fasttext dependency issues on Python 3.13)
+            logger.debug(f"Hazm import failed with error: {e}")
+
+    return _hazm_normalizer_class
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve HAZM_AVAILABLE lazily (PEP 562)."""
+    if name == "HAZM_AVAILABLE":
+        return _load_hazm() is not None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class PersianNormalizer(BaseNormalizer):
@@ -77,9 +92,10 @@ class PersianNormalizer(BaseNormalizer):
         self._fallback_normalizer: Optional[BasicNormalizer] = None
         self.is_hazm_available: bool = False
 
-        if HAZM_AVAILABLE and _HazmNormalizerClass is not None:
+        hazm_normalizer_class = _load_hazm()
+        if hazm_normalizer_class is not None:
             try:
-                self._hazm_normalizer = _HazmNormalizerClass(
+                self._hazm_normalizer = hazm_normalizer_class(
                     remove_extra_spaces=remove_extra_spaces,
                     persian_style=persian_style,
                     persian_numbers=persian_numbers,
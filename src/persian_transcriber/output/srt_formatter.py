@@ -5,7 +5,7 @@ This module provides an SRT (SubRip) subtitle formatter for
 creating subtitle files from transcriptions.
 """
 
-from ..engines.base import TranscriptionResult
+from ..engines.base import TranscriptionResult, TranscriptionSegment
 from .base import BaseFormatter
 
 
@@ -85,18 +85,15 @@ class SrtFormatter(BaseFormatter):
                 )
             return ""
 
-        blocks: list = []
-
-        for index, segment in enumerate(result.segments, start=1):
-            block = self._create_subtitle_block(
+        return "\n\n".join(
+            self._create_subtitle_block(
                 index=index,
                 start=segment.start,
                 end=segment.end,
                 text=segment.text,
             )
-            blocks.append(block)
-
-        return "\n\n".join(blocks)
+            for index, segment in enumerate(result.segments, start=1)
+        )
 
     def _create_subtitle_block(
         self,
@@ -245,29 +242,33 @@ class VttFormatter(BaseFormatter):
         Returns:
             str: The VTT-formatted string.
         """
-        blocks: list = ["WEBVTT", ""]
-
         if not result.segments:
             if result.text:
                 start_time = self._format_timestamp(0.0)
                 end_time = self._format_timestamp(result.duration or 5.0)
-                blocks.append(f"{start_time} --> {end_time}")
-                blocks.append(result.text)
-            return "\n".join(blocks)
+                return f"WEBVTT\n\n{start_time} --> {end_time}\n{result.text}"
+            return "WEBVTT\n"
 
-        for segment in result.segments:
-            start_time = self._format_timestamp(segment.start)
-            end_time = self._format_timestamp(segment.end)
+        cues = "\n\n".join(self._create_cue(segment) for segment in result.segments)
+        return f"WEBVTT\n\n{cues}\n"
 
-            text = segment.text
-            if self.max_line_length > 0:
-                text = self._srt_formatter._wrap_text(text)
+    def _create_cue(self, segment: TranscriptionSegment) -> str:
+        """
+        Create a single WebVTT cue.
 
-            blocks.append(f"{start_time} --> {end_time}")
-            blocks.append(text)
-            blocks.append("")
+        Args:
+            segment: Segment to render.
+
+        Returns:
+            str: Formatted cue.
+        """
+        text = segment.text
+        if self.max_line_length > 0:
+            text = self._srt_formatter._wrap_text(text)
 
-        return "\n".join(blocks)
+        start_time = self._format_timestamp(segment.start)
+        end_time = self._format_timestamp(segment.end)
+        return f"{start_time} --> {end_time}\n{text}"
 
     def _format_timestamp(self, seconds: float) -> str:
         """
@@ -85,10 +85,11 @@ class TxtFormatter(BaseFormatter):
         # Add transcription content
         if self.include_timestamps and result.segments:
             # Format with timestamps
-            for segment in result.segments:
-                start_time = self._format_timestamp(segment.start)
-                end_time = self._format_timestamp(segment.end)
-                lines.append(f"[{start_time} - {end_time}] {segment.text}")
+            lines.extend(
+                f"[{self._format_timestamp(segment.start)} - "
+                f"{self._format_timestamp(segment.end)}] {segment.text}"
+                for segment in result.segments
+            )
         else:
             # Just the text
             lines.append(result.text)
@@ -0,0 +1,312 @@
+"""
+Persistent transcription server over a Unix domain socket.
+
+Loading a model and initialising CUDA takes seconds, which dominates short
+one-off transcriptions. ``persian-transcriber serve`` loads the model once
+and answers requests on a Unix socket; the CLI and :func:`transcribe_file`
+try that socket first and fall back to transcribing locally.
+
+Each message is a 4-byte big-endian length followed by a msgpack payload.
+Requires the optional ``msgpack`` package (``pip install msgpack``).
+
+Example:
+    $ persian-transcriber serve -m large-v3 -d cuda &
+    $ persian-transcriber audio.mp3 -m large-v3 -d cuda   # served by the warm model
+"""
+
+import os
+import socket
+import stat
+import struct
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union, cast
+
+from .utils.exceptions import TranscriberError
+from .utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from .config import TranscriberConfig
+    from .transcriber import PersianAudioTranscriber
+
+logger = get_logger(__name__)
+
+# Environment variable overriding the socket location
+SOCKET_ENV_VAR = "PERSIAN_TRANSCRIBER_SOCKET"
+
+# Seconds a client waits for the server to accept a connection
+CONNECT_TIMEOUT = 0.5
+
+# transcribe_file() options a client may set; the rest of the server's
+# behaviour is fixed by its own configuration
+ALLOWED_OPTIONS = frozenset(
+    {"language", "output_format", "output_path", "save_output", "vad_filter"}
+)
+
+_HEADER = struct.Struct(">I")
+
+_SOCKET_NAME = "persian-transcriber.sock"
+
+
+def _getuid() -> int:
+    return os.getuid() if hasattr(os, "getuid") else 0
+
+
+def default_socket_path() -> str:
+    """
+    Get the socket path used by the server and its clients.
+
+    Returns:
+        str: ``$PERSIAN_TRANSCRIBER_SOCKET`` if set, otherwise a socket in
+        ``$XDG_RUNTIME_DIR``, or in a per-user directory in the system temp
+        directory when that is not set.
+    """
+    if os.environ.get(SOCKET_ENV_VAR):
+        return os.environ[SOCKET_ENV_VAR]
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        return str(Path(os.environ["XDG_RUNTIME_DIR"]) / _SOCKET_NAME)
+    return str(Path(tempfile.gettempdir()) / f"persian-transcriber-{_getuid()}" / _SOCKET_NAME)
+
+
+def _prepare_socket_dir(socket_path: str) -> None:
+    """
+    Create the default per-user socket directory and check that it is private.
+
+    Custom socket paths are used as given; the socket itself is still
+    created owner-only.
+
+    Raises:
+        TranscriberError: If the default directory is owned by another user
+            or is writable by group or others.
+    """
+    directory = os.path.dirname(os.path.abspath(socket_path))
+    if os.environ.get(SOCKET_ENV_VAR) or directory != os.path.dirname(default_socket_path()):
+        return
+
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != _getuid() or info.st_mode & 0o022:
+        raise TranscriberError(f"Refusing to use socket directory {directory}: not private")
+
+
+def _is_trusted_socket(socket_path: str) -> bool:
+    """Check that socket_path is a socket owned by the current user."""
+    try:
+        info = os.lstat(socket_path)
+    except OSError:
+        return False
+    return stat.S_ISSOCK(info.st_mode) and info.st_uid == _getuid()
+
+
+def _config_key(config: "TranscriberConfig") -> Dict[str, Any]:
+    """Settings that must match for the server's model to be reused."""
+    data = config.to_dict()
+    # Output settings only affect how the result is saved, which the server
+    # does per request, so they do not prevent sharing
+    data.pop("output", None)
+    data.pop("verbose", None)
+    return data
+
+
+def _send(conn: socket.socket, payload: Dict[str, Any]) -> None:
+    import msgpack
+
+    data = msgpack.packb(payload, use_bin_type=True)
+    conn.sendall(_HEADER.pack(len(data)) + data)
+
+
+def _recv_exact(conn: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size:
+        chunk = conn.recv(min(size, 1 << 16))
+        if not chunk:
+            raise ConnectionError("Connection closed mid-message")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def _recv(conn: socket.socket) -> Any:
+    """Read one message; the payload is whatever the peer sent, not necessarily a dict."""
+    import msgpack
+
+    (size,) = _HEADER.unpack(_recv_exact(conn, _HEADER.size))
+    return msgpack.unpackb(_recv_exact(conn, size), raw=False)
+
+
+def _handle(transcriber: "PersianAudioTranscriber", request: Any) -> Dict[str, Any]:
+    """Answer a single request with the loaded transcriber."""
+    if not isinstance(request, dict):
+        return {"ok": False, "error": "Malformed request"}
+    if request.get("config") != _config_key(transcriber.config):
+        return {"ok": False, "mismatch": True, "error": "Server runs a different configuration"}
+
+    options = request.get("options", {})
+    if not isinstance(options, dict) or not ALLOWED_OPTIONS.issuperset(options):
+        return {"ok": False, "error": "Unsupported request options"}
+
+    try:
+        result = transcriber.transcribe_file(request["path"], **options)
+    except Exception as e:
+        return {"ok": False, "error": str(e)}
+    return {"ok": True, "result": result}
+
+
+def serve(
+    transcriber: "PersianAudioTranscriber",
+    socket_path: Optional[str] = None,
+) -> None:
+    """
+    Load the model and answer transcription requests until interrupted.
+
+    Requests are handled one at a time, since they all share one model.
+
+    Args:
+        transcriber: Transcriber whose engine serves every request.
+        socket_path: Socket to listen on. Defaults to default_socket_path().
+
+    Raises:
+        TranscriberError: If msgpack or Unix sockets are unavailable, or the
+            socket is already served by another process.
+    """
+    try:
+        import msgpack  # noqa: F401
+    except ImportError as e:
+        raise TranscriberError("msgpack not installed. Run: pip install msgpack") from e
+
+    if not hasattr(socket, "AF_UNIX"):
+        raise TranscriberError("Unix domain sockets are not supported on this platform")
+
+    socket_path = socket_path or default_socket_path()
+    _prepare_socket_dir(socket_path)
+    if os.path.lexists(socket_path):
+        if not _is_trusted_socket(socket_path):
+            raise TranscriberError(f"{socket_path} exists and is not a socket owned by you")
+        if _is_listening(socket_path):
+            raise TranscriberError(f"A server is already listening on {socket_path}")
+        os.unlink(socket_path)  # Stale socket from a crashed server
+
+    transcriber.engine.load_model()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        # Create the socket owner-only from the start rather than chmod after bind
+        old_umask = os.umask(0o177)
+        try:
+            server.bind(socket_path)
+        finally:
+            os.umask(old_umask)
+        server.listen()
+        logger.info(f"Serving {transcriber.engine.name} on {socket_path}")
+
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                try:
+                    _send(conn, _handle(transcriber, _recv(conn)))
+                except (ConnectionError, OSError, ValueError) as e:
+                    logger.warning(f"Dropped client request: {e}")
+    finally:
+        server.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+def _is_listening(socket_path: str) -> bool:
+    """Check whether a server accepts connections on socket_path."""
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    probe.settimeout(CONNECT_TIMEOUT)
+    try:
+        probe.connect(socket_path)
+        return True
+    except OSError:
+        return False
+    finally:
+        probe.close()
+
+
+def request_transcription(
+    file_path: Union[str, Path],
+    config: "TranscriberConfig",
+    socket_path: Optional[str] = None,
+    **options: Any,
+) -> Optional[Dict[str, Any]]:
+    """
+    Transcribe a file on a running server, if one is available.
+
+    Args:
+        file_path: Audio/video file to transcribe.
+        config: Configuration the caller would use locally. The server only
+            answers if its engine, model and language settings match.
+        socket_path: Socket to connect to. Defaults to default_socket_path().
+        **options: Keyword arguments for PersianAudioTranscriber.transcribe_file(),
+            limited to ALLOWED_OPTIONS. Paths are resolved before they are sent.
+
+    Returns:
+        The transcription result, or None if no compatible server is
+        reachable, the socket is not owned by the current user, or options
+        outside ALLOWED_OPTIONS were given, and the caller should transcribe
+        locally.
+
+    Raises:
+        TranscriberError: If the server accepted the request but
+            transcription failed.
+    """
+    socket_path = socket_path or default_socket_path()
+    if not hasattr(socket, "AF_UNIX") or not os.path.lexists(socket_path):
+        return None
+
+    if not _is_trusted_socket(socket_path):
+        logger.warning(f"Ignoring {socket_path}: not a socket owned by the current user")
+        return None
+
+    if not ALLOWED_OPTIONS.issuperset(options):
+        logger.debug("Options not supported by the transcription server; transcribing locally")
+        return None
+
+    try:
+        import msgpack  # noqa: F401
+    except ImportError:
+        return None
+
+    # The server's own output settings may differ, so send the caller's
+    file_path = Path(file_path).resolve()
+    output_format = str(options.get("output_format") or config.output.format)
+    options["output_format"] = output_format
+    if options.get("output_path") is None and options.get("save_output", True):
+        out_dir = config.output.directory or file_path.parent
+        options["output_path"] = Path(out_dir) / f"{file_path.stem}.{output_format}"
+    if options.get("output_path") is not None:
+        options["output_path"] = str(Path(options["output_path"]).resolve())
+
+    request = {
+        "path": str(file_path),
+        "config": _config_key(config),
+        "options": options,
+    }
+
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.settimeout(CONNECT_TIMEOUT)
+        conn.connect(socket_path)
+        conn.settimeout(None)  # Transcription itself may take minutes
+        _send(conn, request)
+        response = _recv(conn)
+    except OSError as e:
+        logger.debug(f"Transcription server unavailable ({e}); transcribing locally")
+        return None
+    finally:
+        conn.close()
+
+    if not isinstance(response, dict):
+        raise TranscriberError("Malformed response from transcription server")
+    if response.get("ok"):
+        return cast(Dict[str, Any], response["result"])
+    if response.get("mismatch"):
+        logger.debug("Transcription server runs a different configuration; transcribing locally")
+        return None
+    raise TranscriberError(f"Server transcription failed: {response.get('error')}")
@@ -6,11 +6,14 @@ the transcription pipeline including engine selection, normalization, and
 output formatting.
 """
 
+import asyncio
+import functools
 import glob
+import json
 import os
 import time
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
 
 from .config import TranscriberConfig, DeviceType, EngineConfig, NormalizerConfig, OutputConfig
 from .engines import get_engine, EngineType
@@ -19,7 +22,7 @@ from .normalizers import get_normalizer, NormalizerType
 from .normalizers.base import BaseNormalizer
 from .output import get_formatter, OutputFormat
 from .output.base import BaseFormatter
-from .utils.audio import prepare_audio_for_transcription
+from .utils.audio import decode_audio, prepare_audio_for_transcription
 from .utils.cuda_setup import setup_cuda_paths
 from .utils.exceptions import (
     AudioProcessingError,
@@ -33,10 +36,13 @@ logger = get_logger(__name__)
 
 
 # Supported file extensions
-AUDIO_EXTENSIONS = {".mp3", ".wav", ".flac", ".ogg", ".m4a", ".aac", ".wma", ".opus"}
-VIDEO_EXTENSIONS = {".mp4", ".mkv", ".avi", ".mov", ".webm", ".wmv", ".flv"}
+AUDIO_EXTENSIONS = frozenset({".mp3", ".wav", ".flac", ".ogg", ".m4a", ".aac", ".wma", ".opus"})
+VIDEO_EXTENSIONS = frozenset({".mp4", ".mkv", ".avi", ".mov", ".webm", ".wmv", ".flv"})
 SUPPORTED_EXTENSIONS = AUDIO_EXTENSIONS | VIDEO_EXTENSIONS
 
+# Engines that accept decoded sample arrays as well as file paths
+ARRAY_ENGINES = {EngineType.WHISPER, EngineType.FASTER_WHISPER, EngineType.WHISPER_TRT}
+
 
 class PersianAudioTranscriber:
     """
@@ -71,6 +77,9 @@ class PersianAudioTranscriber:
         model_size: Optional[str] = None,
         device: Optional[Union[str, DeviceType]] = None,
         compute_type: Optional[str] = None,
+        num_workers: Optional[int] = None,
+        cpu_threads: Optional[int] = None,
+        batch_size: Optional[int] = None,
         language: Optional[str] = None,
         normalize: Optional[bool] = None,
         output_format: Optional[Union[str, OutputFormat]] = None,
@@ -85,7 +94,13 @@ class PersianAudioTranscriber:
             engine: Transcription engine type. Defaults to 'faster_whisper'.
             model_size: Model size for Whisper engines. Defaults to 'medium'.
             device: Computation device ('auto', 'cuda', 'cpu', 'mps').
-            compute_type: Precision type for Faster Whisper.
+            compute_type: Precision type for Faster Whisper ("auto", "float16",
+                "int8_float16", "int8", "float32"). Auto-selected if None.
+            num_workers: Concurrent transcriptions served by one Faster-Whisper
+                model. Set this when sharing one transcriber across threads.
+            cpu_threads: CPU threads per Faster-Whisper worker.
+            batch_size: Decode this many audio chunks per encoder pass with
+                faster-whisper's batched pipeline. Best on a single GPU.
             language: Language code. Defaults to 'fa'.
             normalize: Enable text normalization. Defaults to True.
             output_format: Default output format.
@@ -104,6 +119,9 @@ class PersianAudioTranscriber:
                     model_size=model_size or "medium",
                     device=device or DeviceType.AUTO,
                     compute_type=compute_type,
+                    num_workers=num_workers or 1,
+                    cpu_threads=cpu_threads or 4,
+                    batch_size=batch_size or 0,
                 ),
                 normalizer=NormalizerConfig(
                     enabled=normalize if normalize is not None else True,
@@ -144,12 +162,27 @@ class PersianAudioTranscriber:
 
             logger.info(f"Initializing {engine_type.value} engine...")
 
+            # Precision and worker options only apply to CTranslate2-based engines
+            engine_kwargs: Dict[str, Any] = {}
+            if engine_type in (EngineType.FASTER_WHISPER, EngineType.WHISPER_TRT):
+                engine_kwargs = {
+                    "compute_type": self._config.engine.compute_type,
+                    "num_workers": self._config.engine.num_workers,
+                    "cpu_threads": self._config.engine.cpu_threads,
+                    "device_index": self._config.engine.device_index,
+                    "batch_size": self._config.engine.batch_size,
+                }
+            if engine_type == EngineType.WHISPER_TRT:
+                engine_kwargs["encoder_onnx"] = self._config.engine.encoder_onnx
+            elif engine_type == EngineType.WHISPER:
+                engine_kwargs["use_cuda_graphs"] = self._config.engine.use_cuda_graphs
+
             self._engine = get_engine(
                 engine_type=engine_type,
                 model_size=self._config.engine.model_size,
                 device=str(self._config.engine.device),
-                compute_type=self._config.engine.compute_type,
                 api_key=self._config.openai_api_key,
+                **engine_kwargs,
             )
 
         return self._engine
@@ -180,6 +213,7 @@ class PersianAudioTranscriber:
         output_format: Optional[Union[str, OutputFormat]] = None,
         output_path: Optional[Union[str, Path]] = None,
         save_output: bool = True,
+        vad_filter: Optional[bool] = None,
         **kwargs: Any,
     ) -> Dict[str, Any]:
         """
@@ -191,6 +225,9 @@ class PersianAudioTranscriber:
             output_format: Output format override.
             output_path: Custom output file path.
             save_output: Whether to save the output file.
+            vad_filter: Skip silent audio with Silero VAD before inference
+                (Faster-Whisper based engines only). Defaults to
+                config.engine.vad_filter.
             **kwargs: Additional arguments passed to the engine.
 
         Returns:
@@ -210,19 +247,24 @@ class PersianAudioTranscriber:
         file_path = Path(file_path)
         start_time = time.time()
 
-        # Validate file
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
+        output_path = self._prepare_file(file_path, output_format, output_path, save_output)
 
-        if file_path.suffix.lower() not in SUPPORTED_EXTENSIONS:
-            raise AudioProcessingError(
-                f"Unsupported file format: {file_path.suffix}. "
-                f"Supported: {', '.join(sorted(SUPPORTED_EXTENSIONS))}"
+        # Local Whisper engines take 16 kHz float32 samples decoded in memory
+        if self.engine.engine_type in ARRAY_ENGINES:
+            try:
+                audio = decode_audio(file_path)
+            except Exception as e:
+                raise AudioProcessingError(f"Failed to prepare audio: {e}") from e
+
+            result = self._run_engine(audio, language, vad_filter, kwargs)
+            return self._build_output(
+                result,
+                start_time,
+                output_format=output_format,
+                output_path=output_path if save_output else None,
             )
 
-        logger.info(f"Transcribing: {file_path.name}")
-
-        # Prepare audio for transcription
+        # API engines upload a file, so convert to a temporary WAV if needed
         try:
             audio_path_str, is_temp_file = prepare_audio_for_transcription(str(file_path))
             audio_path = Path(audio_path_str)
@@ -230,81 +272,257 @@ class PersianAudioTranscriber:
             raise AudioProcessingError(f"Failed to prepare audio: {e}") from e
 
         try:
-            # Perform transcription
-            lang = language or self._config.language
-            result = self.engine.transcribe(str(audio_path), language=lang, **kwargs)
-
-            # Normalize text
-            normalized_text = self._normalize_text(result.text)
-            normalized_segments: List[Dict[str, Any]] = []
-
-            for segment in result.segments:
-                normalized_segment: Dict[str, Any] = {
-                    "start": segment.start,
-                    "end": segment.end,
-                    "text": self._normalize_text(segment.text),
-                }
-                normalized_segments.append(normalized_segment)
-
-            # Prepare output
-            output: Dict[str, Any] = {
-                "text": normalized_text,
-                "segments": normalized_segments,
-                "language": result.language,
-                "duration": result.duration,
-                "engine": self.engine.name,
-                "model": self._config.engine.model_size,
-                "processing_time": time.time() - start_time,
-            }
+            result = self._run_engine(str(audio_path), language, vad_filter, kwargs)
+            return self._build_output(
+                result,
+                start_time,
+                output_format=output_format,
+                output_path=output_path if save_output else None,
+            )
 
-            # Save output if requested
-            if save_output:
-                fmt = output_format or self._config.output.format
-                if isinstance(fmt, str):
-                    fmt = OutputFormat(fmt)
-
-                formatter = get_formatter(fmt)
-
-                # Determine output path
-                if output_path is None:
-                    out_dir = self._config.output.directory or file_path.parent
-                    output_path = out_dir / f"{file_path.stem}.{fmt.value}"
-                else:
-                    output_path = Path(output_path)
-
-                # Create a result object with normalized text for saving
-                save_result = TranscriptionResult(
-                    text=normalized_text,
-                    text_raw=result.text,
-                    segments=[
-                        TranscriptionSegment(
-                            text=str(seg["text"]),
-                            start=cast(float, seg["start"]),
-                            end=cast(float, seg["end"]),
-                        )
-                        for seg in normalized_segments
-                    ],
-                    language=result.language,
-                    duration=result.duration,
-                    engine=self.engine.name,
-                    model=self._config.engine.model_size,
-                )
-                formatter.save(save_result, output_path)
-                output["output_path"] = str(output_path)
-                logger.info(f"Saved output to: {output_path}")
+        finally:
+            # Clean up temporary file
+            if is_temp_file and audio_path.exists():
+                try:
+                    audio_path.unlink()
+                except Exception:
+                    pass
 
-            logger.info(f"Transcription completed in {output['processing_time']:.2f}s")
+    async def transcribe_file_async(
+        self,
+        file_path: Union[str, Path],
+        language: Optional[str] = None,
+        output_format: Optional[Union[str, OutputFormat]] = None,
+        output_path: Optional[Union[str, Path]] = None,
+        save_output: bool = True,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """
+        Transcribe a single file without blocking the event loop.
 
-            return output
+        Only available for engines with an async API client (OpenAI API).
+        Running many calls under asyncio.gather() uploads the files
+        concurrently over the engine's pooled connections.
+
+        Args:
+            file_path: Path to the audio/video file.
+            language: Language code override.
+            output_format: Output format override.
+            output_path: Custom output file path.
+            save_output: Whether to save the output file.
+            **kwargs: Additional arguments passed to the engine.
+
+        Returns:
+            Same dictionary as transcribe_file().
+
+        Raises:
+            ConfigurationError: If the engine has no async API.
+            FileNotFoundError: If the input file doesn't exist.
+            AudioProcessingError: If audio extraction/conversion fails.
+            EngineError: If transcription fails.
+
+        Example:
+            >>> results = await asyncio.gather(
+            ...     *(transcriber.transcribe_file_async(f) for f in files)
+            ... )
+        """
+        transcribe_async = getattr(self.engine, "transcribe_async", None)
+        if transcribe_async is None:
+            raise ConfigurationError(
+                f"The {self.engine.name} engine has no async API; use transcribe_file()"
+            )
+
+        file_path = Path(file_path)
+        start_time = time.time()
+
+        output_path = self._prepare_file(file_path, output_format, output_path, save_output)
+
+        # FFmpeg conversion blocks, so run it off the event loop
+        loop = asyncio.get_running_loop()
+        try:
+            audio_path_str, is_temp_file = await loop.run_in_executor(
+                None, prepare_audio_for_transcription, str(file_path)
+            )
+            audio_path = Path(audio_path_str)
+        except Exception as e:
+            raise AudioProcessingError(f"Failed to prepare audio: {e}") from e
+
+        try:
+            result = await transcribe_async(
+                str(audio_path), language=language or self._config.language, **kwargs
+            )
+            return self._build_output(
+                result,
+                start_time,
+                output_format=output_format,
+                output_path=output_path if save_output else None,
+            )
 
         finally:
-            # Clean up temporary file
             if is_temp_file and audio_path.exists():
                 try:
                     audio_path.unlink()
                 except Exception:
                     pass
 
+    def _prepare_file(
+        self,
+        file_path: Path,
+        output_format: Optional[Union[str, OutputFormat]],
+        output_path: Optional[Union[str, Path]],
+        save_output: bool,
+    ) -> Optional[Union[str, Path]]:
+        """Validate an input file and resolve the default output path."""
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        if file_path.suffix.lower() not in SUPPORTED_EXTENSIONS:
+            raise AudioProcessingError(
+                f"Unsupported file format: {file_path.suffix}. "
+                f"Supported: {', '.join(sorted(SUPPORTED_EXTENSIONS))}"
+            )
+
+        logger.info(f"Transcribing: {file_path.name}")
+
+        if save_output and output_path is None:
+            fmt = OutputFormat(output_format or self._config.output.format)
+            out_dir = self._config.output.directory or file_path.parent
+            output_path = out_dir / f"{file_path.stem}.{fmt.value}"
+
+        return output_path
+
+    def transcribe_array(
+        self,
+        audio: Any,
+        sample_rate: int = 16000,
+        language: Optional[str] = None,
+        output_format: Optional[Union[str, OutputFormat]] = None,
+        output_path: Optional[Union[str, Path]] = None,
+        vad_filter: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """
+        Transcribe already-decoded audio samples.
+
+        Lets callers decode audio ahead of time (see
+        utils.audio.prefetch_decoded_audio) instead of inside transcribe_file().
+
+        Args:
+            audio: Mono float32 numpy array of samples.
+            sample_rate: Sample rate of ``audio``. Whisper models expect 16000.
+            language: Language code override.
+            output_format: Output format override.
+            output_path: Save the result here. Nothing is saved if None.
+            vad_filter: Skip silent audio with Silero VAD before inference
+                (Faster-Whisper based engines only). Defaults to
+                config.engine.vad_filter.
+            **kwargs: Additional arguments passed to the engine.
+
+        Returns:
+            Same dictionary as transcribe_file().
+
+        Raises:
+            ConfigurationError: If the engine cannot transcribe sample arrays.
+            AudioProcessingError: If the sample rate is not 16 kHz.
+            EngineError: If transcription fails.
+        """
+        start_time = time.time()
+
+        if self.engine.engine_type not in ARRAY_ENGINES:
+            raise ConfigurationError(
+                f"The {self.engine.name} engine only transcribes files; use transcribe_file()"
+            )
+        if sample_rate != 16000:
+            raise AudioProcessingError(f"Expected 16000 Hz audio for Whisper, got {sample_rate} Hz")
+
+        result = self._run_engine(audio, language, vad_filter, kwargs)
+        return self._build_output(
+            result,
+            start_time,
+            output_format=output_format,
+            output_path=output_path,
+        )
+
+    def _run_engine(
+        self,
+        audio: Any,
+        language: Optional[str],
+        vad_filter: Optional[bool],
+        kwargs: Dict[str, Any],
+    ) -> TranscriptionResult:
+        """Run the engine on a file path or sample array."""
+        lang = language or self._config.language
+        if self.engine.engine_type in (EngineType.FASTER_WHISPER, EngineType.WHISPER_TRT):
+            kwargs["vad_filter"] = (
+                vad_filter if vad_filter is not None else self._config.engine.vad_filter
+            )
+        return self.engine.transcribe(audio, language=lang, **kwargs)
+
+    def _build_output(
+        self,
+        result: TranscriptionResult,
+        start_time: float,
+        output_format: Optional[Union[str, OutputFormat]] = None,
+        output_path: Optional[Union[str, Path]] = None,
+    ) -> Dict[str, Any]:
+        """Normalize an engine result and optionally save it to output_path."""
+        # Normalize text
+        normalized_text = self._normalize_text(result.text)
+        normalized_segments: List[Dict[str, Any]] = []
+
+        for segment in result.segments:
+            normalized_segment: Dict[str, Any] = {
+                "start": segment.start,
+                "end": segment.end,
+                "text": self._normalize_text(segment.text),
+            }
+            normalized_segments.append(normalized_segment)
+
+        # Prepare output
+        output: Dict[str, Any] = {
+            "text": normalized_text,
+            "segments": normalized_segments,
+            "language": result.language,
+            "duration": result.duration,
+            "engine": self.engine.name,
+            "model": self._config.engine.model_size,
+            "processing_time": time.time() - start_time,
+        }
+
+        # Save output if requested
+        if output_path is not None:
+            fmt = output_format or self._config.output.format
+            if isinstance(fmt, str):
+                fmt = OutputFormat(fmt)
+
+            formatter = get_formatter(fmt)
+            output_path = Path(output_path)
+
+            # Create a result object with normalized text for saving
+            save_result = TranscriptionResult(
+                text=normalized_text,
+                text_raw=result.text,
+                segments=[
+                    TranscriptionSegment(
+                        text=str(seg["text"]),
+                        start=cast(float, seg["start"]),
+                        end=cast(float, seg["end"]),
+                    )
+                    for seg in normalized_segments
+                ],
+                language=result.language,
+                duration=result.duration,
+                engine=self.engine.name,
+                model=self._config.engine.model_size,
+            )
+            formatter.save(save_result, output_path)
+            output["output_path"] = str(output_path)
+            logger.info(f"Saved output to: {output_path}")
+
+        logger.info(f"Transcription completed in {output['processing_time']:.2f}s")
+
+        return output
+
     def transcribe(
         self,
         source: Union[str, Path],
@@ -469,19 +687,73 @@ class PersianAudioTranscriber:
         )
 
 
+@functools.lru_cache(maxsize=4)
+def _cached_transcriber(
+    config_json: Optional[str],
+    options: Tuple[Tuple[str, Any], ...],
+) -> PersianAudioTranscriber:
+    """Build a transcriber for a cache key created by get_transcriber()."""
+    if config_json is not None:
+        return PersianAudioTranscriber(config=TranscriberConfig.from_dict(json.loads(config_json)))
+    return PersianAudioTranscriber(**dict(options))
+
+
+def get_transcriber(
+    config: Optional[TranscriberConfig] = None,
+    **options: Any,
+) -> PersianAudioTranscriber:
+    """
+    Get a shared transcriber for a given configuration.
+
+    Transcribers are cached per process (up to four configurations), so
+    repeated calls with identical settings reuse one loaded model instead
+    of reloading its weights. The returned instance is shared; do not
+    mutate its configuration.
+
+    Args:
+        config: Configuration object. Keyed by its contents, so equal
+            configs share a transcriber even if they are distinct objects.
+        **options: Keyword arguments for PersianAudioTranscriber, used when
+            no config is given. Values must be hashable.
+
+    Returns:
+        A cached PersianAudioTranscriber instance.
+
+    Raises:
+        ValueError: If both a config and keyword options are given.
+
+    Example:
+        >>> transcriber = get_transcriber(model_size="large-v3", device="cuda")
+        >>> transcriber is get_transcriber(model_size="large-v3", device="cuda")
+        True
+    """
+    if config is None:
+        return _cached_transcriber(None, tuple(sorted(options.items())))
+
+    if options:
+        raise ValueError("Pass either a config object or keyword options, not both")
+
+    config_data = config.to_dict()
+    config_data["openai_api_key"] = config.openai_api_key
+    return _cached_transcriber(json.dumps(config_data, sort_keys=True, default=str), ())
+
+
 def transcribe_file(
     file_path: Union[str, Path],
     engine: str = "faster_whisper",
     model_size: str = "medium",
     language: str = "fa",
     output_format: str = "txt",
+    use_server: bool = False,
     **kwargs: Any,
 ) -> Dict[str, Any]:
     """
     Convenience function for quick transcription.
 
     This function creates a temporary transcriber instance for
-    one-off transcriptions.
+    one-off transcriptions. With ``use_server=True``, a running
+    ``persian-transcriber serve`` process with the same settings is tried
+    first, so the model does not have to be loaded again.
 
     Args:
         file_path: Path to audio/video file.
@@ -489,6 +761,8 @@ def transcribe_file(
         model_size: Model size.
         language: Language code.
         output_format: Output format.
+        use_server: Try a running transcription server before loading a model.
+            Off by default, so library calls stay in-process.
         **kwargs: Additional arguments.
 
     Returns:
@@ -505,4 +779,11 @@ def transcribe_file(
         output_format=output_format,
     )
 
+    if use_server:
+        from .server import request_transcription
+
+        result = request_transcription(file_path, transcriber.config, **kwargs)
+        if result is not None:
+            return result
+
     return transcriber.transcribe_file(file_path, **kwargs)
@@ -16,19 +16,24 @@ from .audio import (
     SUPPORTED_VIDEO_FORMATS,
     cleanup_temp_file,
     convert_audio,
+    decode_audio,
     extract_audio_from_video,
     get_audio_duration,
     is_supported_format,
     is_video_file,
+    iter_audio_windows,
+    prefetch_decoded_audio,
     prepare_audio_for_transcription,
 )
 from .cuda_setup import (
     GPUInfo,
+    detect_compute_type,
     ensure_cuda_initialized,
     get_best_device,
     get_compute_type,
     get_device_info,
     get_platform,
+    has_avx512_bf16,
     is_cuda_available,
     is_mps_available,
     setup_cuda_paths,
@@ -65,6 +70,9 @@ __all__ = [
     "extract_audio_from_video",
     "convert_audio",
     "prepare_audio_for_transcription",
+    "decode_audio",
+    "prefetch_decoded_audio",
+    "iter_audio_windows",
     "cleanup_temp_file",
     # CUDA utilities
     "GPUInfo",
@@ -74,6 +82,8 @@ __all__ = [
     "is_mps_available",
     "get_best_device",
     "get_compute_type",
+    "detect_compute_type",
+    "has_avx512_bf16",
     "get_device_info",
     "ensure_cuda_initialized",
     # Exceptions
@@ -1,18 +1,23 @@
 """
 Audio processing utilities.
 
-This module provides utilities for audio file handling, including:
+This module provides utilities for audio file handling, built on PyAV
+(FFmpeg) with no intermediate int16 AudioSegment, including:
 - Audio extraction from video files
 - Format conversion
 - Audio duration detection
 - Supported format validation
+- In-memory decoding with read-ahead for batch transcription
+- Windowed decoding of long files in bounded memory
 """
 
 import logging
 import os
 import tempfile
+import wave
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Set, Tuple
+from typing import Any, Iterator, Optional, Sequence, Set, Tuple, Union
 
 from .exceptions import AudioProcessingError, UnsupportedFormatError
 
@@ -47,6 +52,100 @@ SUPPORTED_VIDEO_FORMATS: Set[str] = {
 SUPPORTED_FORMATS: Set[str] = SUPPORTED_AUDIO_FORMATS | SUPPORTED_VIDEO_FORMATS
 
 
+# PyAV resampler layouts for the supported output channel counts
+_CHANNEL_LAYOUTS = {1: "mono", 2: "stereo"}
+
+# FFmpeg muxer names for output formats whose extension differs from the muxer
+_OUTPUT_CONTAINERS = {"m4a": "ipod", "aac": "adts"}
+
+# Encoders used instead of the muxer default (FLAC, which PyAV cannot put in Ogg)
+_OUTPUT_CODECS = {"ogg": "libopus", "opus": "libopus"}
+
+
+def _import_av(file_path: Union[str, Path]) -> Any:
+    """Import PyAV, raising AudioProcessingError if it is missing."""
+    try:
+        import av
+    except ImportError as e:
+        raise AudioProcessingError(
+            "PyAV library not installed. Run: pip install av",
+            file_path=str(file_path),
+        ) from e
+    return av
+
+
+def _write_audio(
+    samples: Any,
+    output_path: Optional[str],
+    output_format: str,
+    sample_rate: int,
+    channels: int,
+) -> str:
+    """
+    Write decoded float32 samples to output_path.
+
+    WAV is written as 16-bit PCM with the standard library; other formats
+    are encoded with PyAV using the container's default audio codec.
+    """
+    output_format = output_format.lower()
+
+    if output_path is None:
+        temp_file = tempfile.NamedTemporaryFile(suffix=f".{output_format}", delete=False)
+        output_path = temp_file.name
+        temp_file.close()
+
+    if output_format != "wav":
+        _encode_audio(samples, output_path, output_format, sample_rate, channels)
+        return output_path
+
+    import numpy as np
+
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767.0).astype("<i2")
+    with wave.open(output_path, "wb") as wav_file:
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(pcm.tobytes())
+
+    return output_path
+
+
+def _encode_audio(
+    samples: Any,
+    output_path: str,
+    output_format: str,
+    sample_rate: int,
+    channels: int,
+) -> None:
+    """Encode interleaved float32 samples into an output_format container with PyAV."""
+    av = _import_av(output_path)
+
+    try:
+        container_format = _OUTPUT_CONTAINERS.get(output_format, output_format)
+        with av.open(output_path, mode="w", format=container_format) as container:
+            codec = _OUTPUT_CODECS.get(output_format)
+            if codec not in av.codecs_available:
+                codec = container.default_audio_codec
+            stream = container.add_stream(codec, rate=sample_rate)
+            stream.layout = _CHANNEL_LAYOUTS[channels]
+
+            frame = av.AudioFrame.from_ndarray(
+                samples.reshape(1, -1), format="flt", layout=_CHANNEL_LAYOUTS[channels]
+            )
+            frame.sample_rate = sample_rate
+
+            # The encoder converts the sample format and frame size it needs
+            for packet in stream.encode(frame):
+                container.mux(packet)
+            for packet in stream.encode(None):
+                container.mux(packet)
+    except Exception as e:
+        raise AudioProcessingError(
+            f"Failed to encode {output_format} audio: {e}",
+            file_path=output_path,
+        ) from e
+
+
 def is_supported_format(file_path: str) -> bool:
     """
     Check if a file format is supported.
@@ -98,22 +197,23 @@ def get_audio_duration(file_path: str) -> float:
         >>> duration = get_audio_duration("audio.mp3")
         >>> print(f"Duration: {duration:.2f} seconds")
     """
-    try:
-        from pydub import AudioSegment
+    av = _import_av(file_path)
 
-        audio = AudioSegment.from_file(file_path)
-        return len(audio) / 1000.0  # Convert milliseconds to seconds
-    except ImportError:
-        logger.warning("pydub not installed, cannot get audio duration")
-        raise AudioProcessingError(
-            "pydub library not installed. Run: pip install pydub",
-            file_path=file_path,
-        )
+    try:
+        with av.open(str(file_path), metadata_errors="ignore") as container:
+            if container.duration is not None:
+                return float(container.duration / av.time_base)
+            stream = container.streams.audio[0]
+            if stream.duration is not None and stream.time_base is not None:
+                return float(stream.duration * stream.time_base)
     except Exception as e:
         raise AudioProcessingError(
             f"Failed to get audio duration: {e}",
             file_path=file_path,
-        )
+        ) from e
+
+    # No duration in the container header; decode to count samples
+    return len(decode_audio(file_path)) / 16000.0
 
 
 def extract_audio_from_video(
@@ -130,7 +230,8 @@ def extract_audio_from_video(
         video_path: Path to the video file.
         output_path: Optional output path for the audio file.
                     If not provided, a temporary file will be created.
-        output_format: Output audio format (default: "wav").
+        output_format: Output audio format (default: "wav", written as 16-bit
+                      PCM). Other formats are encoded with PyAV.
         sample_rate: Output sample rate in Hz (default: 16000).
         channels: Number of audio channels (default: 1 for mono).
 
@@ -158,43 +259,17 @@ def extract_audio_from_video(
             _path.suffix,
         )
 
-    try:
-        from pydub import AudioSegment
-
-        logger.info(f"Extracting audio from video: {_path.name}")
-
-        # Load video file (pydub/ffmpeg handles the extraction)
-        audio = AudioSegment.from_file(str(_path))
-
-        # Convert to specified format
-        audio = audio.set_frame_rate(sample_rate)
-        audio = audio.set_channels(channels)
-
-        # Determine output path
-        if output_path is None:
-            temp_file = tempfile.NamedTemporaryFile(
-                suffix=f".{output_format}",
-                delete=False,
-            )
-            output_path = temp_file.name
-            temp_file.close()
-
-        # Export audio
-        audio.export(output_path, format=output_format)
+    logger.info(f"Extracting audio from video: {_path.name}")
+    output_path = _write_audio(
+        decode_audio(_path, sample_rate=sample_rate, channels=channels),
+        output_path,
+        output_format,
+        sample_rate,
+        channels,
+    )
 
-        logger.info(f"Audio extracted successfully: {output_path}")
-        return output_path
-
-    except ImportError:
-        raise AudioProcessingError(
-            "pydub library not installed. Run: pip install pydub",
-            file_path=str(video_path),
-        )
-    except Exception as e:
-        raise AudioProcessingError(
-            f"Failed to extract audio from video: {e}",
-            file_path=str(video_path),
-        )
+    logger.info(f"Audio extracted successfully: {output_path}")
+    return output_path
 
 
 def convert_audio(
@@ -211,7 +286,8 @@ def convert_audio(
         input_path: Path to the input audio file.
         output_path: Optional output path. If not provided, a temporary
                     file will be created.
-        output_format: Output audio format (default: "wav").
+        output_format: Output audio format (default: "wav", written as 16-bit
+                      PCM). Other formats are encoded with PyAV.
         sample_rate: Output sample rate in Hz (default: 16000).
         channels: Number of audio channels (default: 1 for mono).
 
@@ -233,43 +309,17 @@ def convert_audio(
             file_path=str(_input_path),
         )
 
-    try:
-        from pydub import AudioSegment
-
-        logger.debug(f"Converting audio: {_input_path.name} -> {output_format}")
-
-        # Load audio file
-        audio = AudioSegment.from_file(str(_input_path))
-
-        # Convert parameters
-        audio = audio.set_frame_rate(sample_rate)
-        audio = audio.set_channels(channels)
-
-        # Determine output path
-        if output_path is None:
-            temp_file = tempfile.NamedTemporaryFile(
-                suffix=f".{output_format}",
-                delete=False,
-            )
-            output_path = temp_file.name
-            temp_file.close()
-
-        # Export audio
-        audio.export(output_path, format=output_format)
+    logger.debug(f"Converting audio: {_input_path.name} -> {output_format}")
+    output_path = _write_audio(
+        decode_audio(_input_path, sample_rate=sample_rate, channels=channels),
+        output_path,
+        output_format,
+        sample_rate,
+        channels,
+    )
 
-        logger.debug(f"Audio converted successfully: {output_path}")
-        return output_path
-
-    except ImportError:
-        raise AudioProcessingError(
-            "pydub library not installed. Run: pip install pydub",
-            file_path=str(input_path),
-        )
-    except Exception as e:
-        raise AudioProcessingError(
-            f"Failed to convert audio: {e}",
-            file_path=str(input_path),
-        )
+    logger.debug(f"Audio converted successfully: {output_path}")
+    return output_path
 
 
 def prepare_audio_for_transcription(
@@ -327,12 +377,11 @@ def prepare_audio_for_transcription(
     # WAV files at correct sample rate can be used directly
     if ext == ".wav":
         try:
-            from pydub import AudioSegment
-
-            audio = AudioSegment.from_file(str(file_path))
-            if audio.frame_rate == target_sample_rate:
-                return str(file_path), False
+            with wave.open(str(file_path), "rb") as wav_file:
+                if wav_file.getframerate() == target_sample_rate:
+                    return str(file_path), False
         except Exception:
+            # Not plain PCM (e.g. float WAV); convert below
             pass
 
     # Convert to WAV for optimal compatibility
@@ -344,6 +393,165 @@ def prepare_audio_for_transcription(
     return converted_path, True
 
 
+def decode_audio(
+    file_path: Union[str, Path],
+    sample_rate: int = 16000,
+    channels: int = 1,
+) -> Any:
+    """
+    Decode an audio or video file to mono float32 samples.
+
+    Uses PyAV (FFmpeg) directly, so no intermediate WAV file is written.
+
+    Args:
+        file_path: Path to the audio or video file.
+        sample_rate: Output sample rate in Hz (default: 16000).
+        channels: Output channel count, 1 (mono, default) or 2 (stereo).
+                 Stereo samples are returned interleaved.
+
+    Returns:
+        numpy.ndarray: 1-D float32 array of samples in [-1, 1].
+
+    Raises:
+        ValueError: If channels is not 1 or 2.
+        AudioProcessingError: If PyAV is missing or decoding fails.
+
+    Example:
+        >>> samples = decode_audio("audio.mp3")
+        >>> print(f"Duration: {len(samples) / 16000:.2f} seconds")
+    """
+    if channels not in _CHANNEL_LAYOUTS:
+        raise ValueError(f"Unsupported channel count: {channels} (expected 1 or 2)")
+
+    av = _import_av(file_path)
+    import numpy as np
+
+    chunks = list(_iter_resampled(av, file_path, sample_rate, channels))
+    if not chunks:
+        return np.zeros(0, dtype=np.float32)
+    return np.concatenate(chunks).astype(np.float32, copy=False)
+
+
+def _iter_resampled(
+    av: Any,
+    file_path: Union[str, Path],
+    sample_rate: int,
+    channels: int,
+) -> Iterator[Any]:
+    """Yield 1-D float32 sample chunks as PyAV decodes and resamples them."""
+    layout = _CHANNEL_LAYOUTS[channels]
+
+    try:
+        resampler = av.AudioResampler(format="flt", layout=layout, rate=sample_rate)
+
+        with av.open(str(file_path), metadata_errors="ignore") as container:
+            for frame in container.decode(audio=0):
+                for resampled in resampler.resample(frame):
+                    yield resampled.to_ndarray().reshape(-1)
+
+        # Flush samples buffered inside the resampler
+        for resampled in resampler.resample(None):
+            yield resampled.to_ndarray().reshape(-1)
+
+    except Exception as e:
+        raise AudioProcessingError(
+            f"Failed to decode audio: {e}",
+            file_path=str(file_path),
+        ) from e
+
+
+def iter_audio_windows(
+    file_path: Union[str, Path],
+    window_seconds: float = 30.0,
+    sample_rate: int = 16000,
+) -> Iterator[Tuple[float, Any]]:
+    """
+    Decode a file lazily into fixed-length mono windows.
+
+    Only one window of samples is held in memory at a time, so peak usage
+    does not grow with file length (30s at 16 kHz is under 2MB of float32,
+    whereas a fully decoded 2h file is about 460MB).
+
+    Args:
+        file_path: Path to the audio or video file.
+        window_seconds: Window length in seconds (default: 30, Whisper's
+                       native input length).
+        sample_rate: Output sample rate in Hz (default: 16000).
+
+    Yields:
+        Tuple[float, numpy.ndarray]: Start offset of the window in seconds
+        and its float32 samples. The last window may be shorter.
+
+    Raises:
+        AudioProcessingError: If PyAV is missing or decoding fails.
+
+    Example:
+        >>> for offset, samples in iter_audio_windows("lecture.mp3"):
+        ...     result = transcriber.transcribe_array(samples)
+    """
+    av = _import_av(file_path)
+    import numpy as np
+
+    window_size = int(window_seconds * sample_rate)
+    pending: list = []
+    pending_size = 0
+    offset = 0
+
+    for chunk in _iter_resampled(av, file_path, sample_rate, channels=1):
+        pending.append(chunk)
+        pending_size += len(chunk)
+
+        while pending_size >= window_size:
+            samples = np.concatenate(pending)
+            yield offset / sample_rate, samples[:window_size]
+            offset += window_size
+            pending = [samples[window_size:]]
+            pending_size -= window_size
+
+    if pending_size:
+        yield offset / sample_rate, np.concatenate(pending)
+
+
+def prefetch_decoded_audio(
+    paths: Sequence[Union[str, Path]],
+    sample_rate: int = 16000,
+) -> Iterator[Tuple[Path, Any]]:
+    """
+    Decode files one ahead of the consumer on a background thread.
+
+    While the caller transcribes file N, file N+1 is already being decoded,
+    so FFmpeg work overlaps with model inference instead of alternating
+    with it.
+
+    Args:
+        paths: Audio or video files, in processing order.
+        sample_rate: Output sample rate in Hz (default: 16000).
+
+    Yields:
+        Tuple[Path, Optional[numpy.ndarray]]: Each path with its decoded
+        samples, or None if the file could not be decoded (the error is
+        logged and the remaining files are still processed).
+
+    Example:
+        >>> for path, samples in prefetch_decoded_audio(files):
+        ...     result = transcriber.transcribe_array(samples)
+    """
+    if not paths:
+        return
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(decode_audio, paths[0], sample_rate)
+        for i, path in enumerate(paths):
+            try:
+                samples = future.result()
+            except AudioProcessingError as e:
+                logger.warning(f"Skipping undecodable file: {e}")
+                samples = None
+            if i + 1 < len(paths):
+                future = pool.submit(decode_audio, paths[i + 1], sample_rate)
+            yield Path(path), samples
+
+
 def cleanup_temp_file(file_path: str) -> None:
     """
     Safely remove a temporary file.
@@ -464,6 +464,118 @@ def get_compute_type(device: str) -> str:
     return compute_types.get(device, "int8")
 
 
+# Compute types in order of preference for detect_compute_type(), narrowest first
+COMPUTE_TYPE_PREFERENCE: List[str] = ["int8_float16", "float16", "int8", "float32"]
+
+# Preference when accuracy matters more than throughput: no int8 quantization
+ACCURATE_COMPUTE_TYPE_PREFERENCE: List[str] = ["bfloat16", "float16", "float32"]
+
+# Cached result of has_avx512_bf16()
+_avx512_bf16_cache: Optional[bool] = None
+
+
+def has_avx512_bf16() -> bool:
+    """
+    Check whether the CPU supports AVX512_BF16 instructions.
+
+    Cooper Lake and later Xeons run bfloat16 dot products (VDPBF16PS) at
+    about twice the fp32 throughput, so CTranslate2's "bfloat16" compute
+    type is only worth using when this flag is present.
+
+    Reads /proc/cpuinfo on Linux, and py-cpuinfo elsewhere if installed.
+
+    Returns:
+        bool: True if the avx512_bf16 CPU flag is present.
+    """
+    global _avx512_bf16_cache
+
+    if _avx512_bf16_cache is not None:
+        return _avx512_bf16_cache
+
+    flags: List[str] = []
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("flags"):
+                    flags = line.split(":", 1)[1].split()
+                    break
+    except OSError:
+        try:
+            import cpuinfo
+
+            flags = cpuinfo.get_cpu_info().get("flags", [])
+        except ImportError:
+            logger.debug("py-cpuinfo not installed, assuming no AVX512_BF16 support")
+        except Exception as e:
+            logger.debug(f"Error reading CPU flags: {e}")
+
+    _avx512_bf16_cache = "avx512_bf16" in flags
+    return _avx512_bf16_cache
+
+
+def detect_compute_type(device: str, device_index: int = 0, prefer_accuracy: bool = False) -> str:
+    """
+    Detect the narrowest compute type supported by a device.
+
+    Queries CTranslate2 for the compute types the device actually supports
+    and picks the first match from COMPUTE_TYPE_PREFERENCE; no capability
+    thresholds are hard-coded here. On CUDA GPUs that CTranslate2 reports
+    as supporting "int8_float16" (int8 weight storage with FP16 matmuls,
+    backed by int8 Tensor Cores from Turing, SM 7.5, onwards) this is the
+    result; GPUs without it fall back to "float16", and CPUs resolve to
+    "int8". This is what compute_type="auto" resolves to in the
+    Faster-Whisper engine.
+
+    With prefer_accuracy, ACCURATE_COMPUTE_TYPE_PREFERENCE is used instead
+    (compute_type="auto_accurate"): "bfloat16" on CPUs with AVX512_BF16 and
+    on GPUs that support it, "float16" on other GPUs and "float32" on other
+    CPUs.
+
+    Args:
+        device: Device identifier ("cuda", "mps", or "cpu").
+        device_index: Index of the device to query (default: 0).
+        prefer_accuracy: Skip int8 quantized types.
+
+    Returns:
+        str: Detected compute type. Falls back to get_compute_type() if
+            CTranslate2 is not installed or the device cannot be queried.
+
+    Example:
+        >>> detect_compute_type("cuda")
+        'int8_float16'
+        >>> detect_compute_type("cpu")
+        'int8'
+        >>> detect_compute_type("cpu", prefer_accuracy=True)  # on a Sapphire Rapids Xeon
+        'bfloat16'
+    """
+    # CTranslate2 has no MPS backend
+    if device not in ("cuda", "cpu"):
+        return get_compute_type(device)
+
+    try:
+        import ctranslate2
+
+        supported = set(ctranslate2.get_supported_compute_types(device, device_index))
+    except ImportError:
+        logger.debug("CTranslate2 not installed, using default compute type")
+        return get_compute_type(device)
+    except Exception as e:
+        logger.debug(f"Error querying supported compute types: {e}")
+        return get_compute_type(device)
+
+    # Without AVX512_BF16, CTranslate2 emulates bfloat16 on CPU, which is slower
+    if device == "cpu" and not has_avx512_bf16():
+        supported.discard("bfloat16")
+
+    preference = ACCURATE_COMPUTE_TYPE_PREFERENCE if prefer_accuracy else COMPUTE_TYPE_PREFERENCE
+    for compute_type in preference:
+        if compute_type in supported:
+            logger.debug(f"Detected compute type for {device}: {compute_type}")
+            return compute_type
+
+    return get_compute_type(device)
+
+
 def get_device_info() -> GPUInfo:
     """
     Get detailed GPU information.
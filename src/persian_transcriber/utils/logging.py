@@ -6,12 +6,15 @@ both console and file output, colored formatting, and configurable
 log levels. Configuration is read from config.yaml if available.
 """
 
+import functools
 import logging
 import os
+import re
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 # Default log format
 DEFAULT_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
@@ -20,6 +23,18 @@ DEFAULT_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 # Shorter format for console
 CONSOLE_FORMAT = "%(levelname)-8s | %(message)s"
 
+# Level names accepted by setup_logging() and set_log_level()
+_LEVEL_MAP: Dict[str, int] = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "WARN": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+    "FATAL": logging.CRITICAL,
+    "NOTSET": logging.NOTSET,
+}
+
 # Default configuration
 DEFAULT_CONFIG: Dict[str, Any] = {
     "level": "INFO",
@@ -50,63 +65,133 @@ ANSI_COLORS = {
     "bold": "\033[1m",
 }
 
-# Module-level logger cache
-_loggers: Dict[str, logging.Logger] = {}
-_config_cache: Optional[Dict[str, Any]] = None
-_initialized: bool = False
+# Width of a padded %(levelname)-Ns field in a format string
+_LEVELNAME_WIDTH = re.compile(r"%\(levelname\)-(\d+)s")
 
+# Set to skip looking for config.yaml entirely (e.g. in CI or containers)
+NO_CONFIG_ENV_VAR = "PERSIAN_TRANSCRIBER_NO_CONFIG"
 
-def _load_config() -> Dict[str, Any]:
-    """Load logging configuration from config.yaml."""
-    global _config_cache
+# Config file names, in order of preference
+CONFIG_FILE_NAMES = ("config.yaml", "config.yml")
 
-    if _config_cache is not None:
-        return _config_cache
+# The package root logger, looked up once instead of on every helper call
+_ROOT = logging.getLogger("persian_transcriber")
 
-    config = DEFAULT_CONFIG.copy()
+# Cached result of ColoredFormatter._supports_color(), computed on first use
+_color_supported: Optional[bool] = None
+
+# Serializes handler reconfiguration in setup_logging()
+_setup_lock = threading.Lock()
+
+# Handlers installed by setup_logging(), keyed by the settings they were built
+# with, so repeated calls keep matching handlers instead of reopening files
+_current_handlers: Dict[Tuple[Any, ...], logging.Handler] = {}
+
+
+def _find_in_dir(directory: Path) -> Optional[Path]:
+    """Find a config file in directory with one listing instead of a stat per name."""
+    try:
+        with os.scandir(directory) as entries:
+            names = {entry.name for entry in entries if entry.name in CONFIG_FILE_NAMES}
+    except OSError:
+        return None
 
-    # Search for config.yaml in common locations
-    search_paths = [
-        Path.cwd() / "config.yaml",
-        Path.cwd() / "config.yml",
-        Path(__file__).parent.parent.parent.parent / "config.yaml",
-        Path(__file__).parent.parent.parent.parent / "config.yml",
-        Path.home() / ".persian_transcriber" / "config.yaml",
-    ]
+    for name in CONFIG_FILE_NAMES:
+        if name in names:
+            return directory / name
+    return None
 
-    # Also check environment variable
+
+def _find_config_file() -> Optional[Path]:
+    """
+    Locate config.yaml in the usual places.
+
+    Searched in order: $PERSIAN_TRANSCRIBER_CONFIG, the working directory,
+    the project root, and ~/.persian_transcriber/config.yaml.
+    """
     if os.environ.get("PERSIAN_TRANSCRIBER_CONFIG"):
-        search_paths.insert(0, Path(os.environ["PERSIAN_TRANSCRIBER_CONFIG"]))
+        env_path = Path(os.environ["PERSIAN_TRANSCRIBER_CONFIG"])
+        if env_path.exists():
+            return env_path
 
-    config_path = None
-    for path in search_paths:
-        if path.exists():
-            config_path = path
-            break
+    project_root, home_config = _static_search_paths()
+
+    # The working directory can change between calls, so it is not cached
+    for directory in (Path.cwd(), project_root):
+        found = _find_in_dir(directory)
+        if found is not None:
+            return found
+
+    if home_config is not None and home_config.exists():
+        return home_config
+
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _static_search_paths() -> Tuple[Path, Optional[Path]]:
+    """Config locations that are fixed for the life of the process."""
+    project_root = Path(__file__).parent.parent.parent.parent
+
+    # Path.home() falls back to the password database, so only probe it
+    # when a home directory is actually configured
+    home_config = None
+    if os.environ.get("HOME") or os.environ.get("USERPROFILE"):
+        home_config = Path.home() / ".persian_transcriber" / "config.yaml"
+
+    return project_root, home_config
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_config(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse the logging section of a config file.
+
+    mtime_ns and size are only part of the cache key, so an unchanged file
+    is parsed once per process and an edited one is parsed again.
+    """
+    config = DEFAULT_CONFIG.copy()
+
+    try:
+        import yaml
+
+        # The libyaml-based loader is several times faster when available
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with open(path, "r", encoding="utf-8") as f:
+            yaml_config = yaml.load(f, Loader=loader)
+
+        if yaml_config and "logging" in yaml_config:
+            logging_config = yaml_config["logging"]
+            for key in DEFAULT_CONFIG:
+                if key in logging_config:
+                    config[key] = logging_config[key]
+    except ImportError:
+        # PyYAML not installed, use defaults
+        pass
+    except Exception:
+        # Config file error, use defaults
+        pass
 
-    if config_path is not None:
-        try:
-            import yaml
-
-            with open(config_path, "r", encoding="utf-8") as f:
-                yaml_config = yaml.safe_load(f)
-
-            if yaml_config and "logging" in yaml_config:
-                logging_config = yaml_config["logging"]
-                for key in DEFAULT_CONFIG:
-                    if key in logging_config:
-                        config[key] = logging_config[key]
-        except ImportError:
-            # PyYAML not installed, use defaults
-            pass
-        except Exception:
-            # Config file error, use defaults
-            pass
-
-    _config_cache = config
     return config
 
 
+def _load_config() -> Dict[str, Any]:
+    """Load logging configuration from config.yaml."""
+    if os.environ.get(NO_CONFIG_ENV_VAR):
+        return DEFAULT_CONFIG.copy()
+
+    config_path = _find_config_file()
+    if config_path is None:
+        return DEFAULT_CONFIG.copy()
+
+    try:
+        st = os.stat(config_path)
+    except OSError:
+        return DEFAULT_CONFIG.copy()
+
+    return dict(_parse_config(str(config_path), st.st_mtime_ns, st.st_size))
+
+
 class ColoredFormatter(logging.Formatter):
     """
     Logging formatter that adds colors to log levels for console output.
@@ -146,8 +231,24 @@ class ColoredFormatter(logging.Formatter):
             color_config: Custom color configuration from config.yaml.
         """
         super().__init__(fmt=fmt, datefmt=datefmt)
-        self.use_colors = use_colors and self._supports_color()
+        self.use_colors = use_colors and _terminal_supports_color()
         self.color_config = color_config or {}
+        self._reset = ANSI_COLORS["reset"]
+
+        # Pad inside the color codes: the escape sequences would otherwise
+        # count towards a %(levelname)-8s width and break column alignment
+        match = _LEVELNAME_WIDTH.search(fmt or "")
+        self._levelname_width = int(match.group(1)) if match else 0
+
+        # Colored level names built once per level rather than per record
+        self._colored_names: Dict[int, str] = {
+            level: self._colorize(logging.getLevelName(level), level) for level in self.COLORS
+        }
+
+    def _colorize(self, level_name: str, level_no: int) -> str:
+        """Build the padded, colored display name for a level."""
+        color = self._get_color_code(level_name, level_no)
+        return f"{color}{level_name:<{self._levelname_width}}{self._reset}"
 
     @staticmethod
     def _supports_color() -> bool:
@@ -197,12 +298,47 @@ class ColoredFormatter(logging.Formatter):
         Returns:
             str: Formatted log message with optional colors.
         """
-        if self.use_colors:
-            color = self._get_color_code(record.levelname, record.levelno)
-            reset = ANSI_COLORS["reset"]
-            record.levelname = f"{color}{record.levelname}{reset}"
+        if not self.use_colors:
+            return super().format(record)
+
+        levelname = record.levelname
+        colored = self._colored_names.get(record.levelno)
+        if colored is None:
+            # Custom level: build its name once and remember it
+            colored = self._colored_names[record.levelno] = self._colorize(
+                levelname, record.levelno
+            )
+
+        # Records are shared between handlers, so restore the plain name afterwards
+        record.levelname = colored
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
-        return super().format(record)
+
+def _expand_log_file(template: str) -> Path:
+    """
+    Expand {date} and {time} placeholders in a configured log file path.
+
+    Expanded on every call, so a long-running process that reconfigures
+    logging moves on to the current date. setup_logging() reuses the open
+    file handler while the expanded path stays the same.
+    """
+    if "{" in template:
+        now = datetime.now()
+        template = template.replace("{date}", now.strftime("%Y-%m-%d"))
+        template = template.replace("{time}", now.strftime("%H-%M-%S"))
+    return Path(template)
+
+
+def _terminal_supports_color() -> bool:
+    """Return ColoredFormatter._supports_color(), evaluated once per process."""
+    global _color_supported
+
+    if _color_supported is None:
+        _color_supported = ColoredFormatter._supports_color()
+    return _color_supported
 
 
 def setup_logging(
@@ -243,8 +379,6 @@ def setup_logging(
         >>> logger = setup_logging(level=logging.DEBUG)
         >>> logger.info("Transcription started")
     """
-    global _initialized
-
     # Load configuration from config.yaml
     config = _load_config()
 
@@ -253,21 +387,13 @@ def setup_logging(
         level = logging.DEBUG
     elif level is not None:
         if isinstance(level, str):
-            level = getattr(logging, level.upper(), logging.INFO)
+            level = _LEVEL_MAP.get(level.upper(), logging.INFO)
     else:
-        level = getattr(logging, config["level"].upper(), logging.INFO)
+        level = _LEVEL_MAP.get(str(config["level"]).upper(), logging.INFO)
 
     # Get other settings from config or parameters
     if log_file is None and config.get("log_file_path"):
-        log_file_str = config["log_file_path"]
-        # Expand placeholders
-        now = datetime.now()
-        log_file_str = log_file_str.replace("{date}", now.strftime("%Y-%m-%d"))
-        log_file_str = log_file_str.replace("{time}", now.strftime("%H-%M-%S"))
-        log_file = Path(log_file_str)
-
-    if use_colors is None:
-        use_colors = config.get("use_colors", True)
+        log_file = _expand_log_file(str(config["log_file_path"]))
 
     if log_format is None:
         log_format = config.get("format", DEFAULT_FORMAT)
@@ -275,54 +401,87 @@ def setup_logging(
     if date_format is None:
         date_format = config.get("date_format", DEFAULT_DATE_FORMAT)
 
-    color_config = config.get("colors", {})
-
-    # Get the package root logger
-    root_logger = logging.getLogger("persian_transcriber")
-
-    # Clear any existing handlers
-    root_logger.handlers.clear()
-
-    # Set the log level
-    root_logger.setLevel(level)
-
-    # Create console handler
+    # Signatures of the handlers this call wants; the level is applied with
+    # setLevel() and does not require a new handler
+    wanted: Dict[Tuple[Any, ...], Any] = {}
     if not quiet:
-        console_handler = logging.StreamHandler(sys.stderr)
-        console_handler.setLevel(level)
-
-        console_formatter = ColoredFormatter(
-            fmt=CONSOLE_FORMAT,
-            datefmt=date_format,
-            use_colors=use_colors,
-            color_config=color_config,
+        if use_colors is None:
+            use_colors = config.get("use_colors", True)
+        color_config = config.get("colors", {})
+        console_key = (
+            "console",
+            id(sys.stderr),
+            date_format,
+            bool(use_colors),
+            repr(sorted(color_config.items())),
         )
-        console_handler.setFormatter(console_formatter)
-        root_logger.addHandler(console_handler)
-
-    # Create file handler if log_file is specified
+        wanted[console_key] = color_config
     if log_file is not None:
         log_file = Path(log_file)
-        log_file.parent.mkdir(parents=True, exist_ok=True)
-
-        file_handler = logging.FileHandler(
-            log_file,
-            mode="a",
-            encoding="utf-8",
-        )
-        file_handler.setLevel(logging.DEBUG)  # Always log everything to file
-
-        file_formatter = logging.Formatter(
-            fmt=log_format,
-            datefmt=date_format,
-        )
-        file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
-
-    # Prevent propagation to root logger
-    root_logger.propagate = False
-
-    _initialized = True
+        wanted[("file", os.path.abspath(log_file), log_format, date_format)] = log_file
+
+    with _setup_lock:
+        # Get the package root logger
+        root_logger = _ROOT
+
+        # Drop handlers that are no longer wanted, including any added outside
+        # setup_logging(); close the ones we opened so their files are released
+        for key, stale in list(_current_handlers.items()):
+            if key not in wanted:
+                del _current_handlers[key]
+                root_logger.removeHandler(stale)
+                stale.close()
+        for foreign in root_logger.handlers[:]:
+            if foreign not in _current_handlers.values():
+                root_logger.removeHandler(foreign)
+
+        # Set the log level
+        root_logger.setLevel(level)
+
+        for key, value in wanted.items():
+            existing: Optional[logging.Handler] = _current_handlers.get(key)
+            if existing is not None:
+                # set_log_level() may have changed either handler's level
+                existing.setLevel(level if key[0] == "console" else logging.DEBUG)
+                root_logger.addHandler(existing)  # No-op unless removed by hand
+                continue
+
+            handler: logging.Handler
+
+            if key[0] == "console":
+                # Create console handler; its formatter (and the terminal
+                # color probe) is only built when console output is wanted
+                handler = logging.StreamHandler(sys.stderr)
+                handler.setLevel(level)
+                handler.setFormatter(
+                    ColoredFormatter(
+                        fmt=CONSOLE_FORMAT,
+                        datefmt=date_format,
+                        use_colors=bool(use_colors),
+                        color_config=value,
+                    )
+                )
+            else:
+                # Create file handler for log_file
+                value.parent.mkdir(parents=True, exist_ok=True)
+                handler = logging.FileHandler(
+                    value,
+                    mode="a",
+                    encoding="utf-8",
+                )
+                handler.setLevel(logging.DEBUG)  # Always log everything to file
+                handler.setFormatter(
+                    logging.Formatter(
+                        fmt=log_format,
+                        datefmt=date_format,
+                    )
+                )
+
+            _current_handlers[key] = handler
+            root_logger.addHandler(handler)
+
+        # Prevent propagation to root logger
+        root_logger.propagate = False
 
     return root_logger
 
@@ -345,20 +504,10 @@ def get_logger(name: str) -> logging.Logger:
         >>> logger = get_logger(__name__)
         >>> logger.info("Processing audio file")
     """
-    global _initialized
-
-    # Auto-initialize with config if not already done
-    if not _initialized:
-        setup_logging()
-
     # Handle both full module paths and short names
     if not name.startswith("persian_transcriber"):
         name = f"persian_transcriber.{name}"
-
-    if name not in _loggers:
-        _loggers[name] = logging.getLogger(name)
-
-    return _loggers[name]
+    return logging.getLogger(name)
 
 
 def set_log_level(level: Union[int, str]) -> None:
@@ -375,12 +524,11 @@ def set_log_level(level: Union[int, str]) -> None:
         >>> set_log_level("WARNING")  # Or use string
     """
     if isinstance(level, str):
-        level = getattr(logging, level.upper(), logging.INFO)
+        level = _LEVEL_MAP.get(level.upper(), logging.INFO)
 
-    root_logger = logging.getLogger("persian_transcriber")
-    root_logger.setLevel(level)
+    _ROOT.setLevel(level)
 
-    for handler in root_logger.handlers:
+    for handler in _ROOT.handlers:
         handler.setLevel(level)
 
 
@@ -394,7 +542,7 @@ def disable_logging() -> None:
         >>> from persian_transcriber.utils.logging import disable_logging
         >>> disable_logging()
     """
-    logging.getLogger("persian_transcriber").disabled = True
+    _ROOT.disabled = True
 
 
 def enable_logging() -> None:
@@ -405,4 +553,9 @@ def enable_logging() -> None:
         >>> from persian_transcriber.utils.logging import enable_logging
         >>> enable_logging()
     """
-    logging.getLogger("persian_transcriber").disabled = False
+    _ROOT.disabled = False
+
+
+# Configure the package logger from config.yaml once, when this module is
+# first imported. The import lock makes this one-time even across threads.
+setup_logging()
@@ -91,7 +91,23 @@ def mock_openai_client(monkeypatch: pytest.MonkeyPatch) -> types.ModuleType:
         def __init__(self, **kwargs):  # pylint: disable=unused-argument
             self.audio = _DummyAudioEndpoint()
 
+    class _DummyAsyncAudioEndpoint(_DummyAudioEndpoint):
+        async def create(self, *args, **kwargs):  # pylint: disable=invalid-overridden-method
+            return super().create(*args, **kwargs)
+
+    class _DummyAsyncClient:
+        instances = 0
+
+        def __init__(self, **kwargs):  # pylint: disable=unused-argument
+            type(self).instances += 1
+            self.audio = _DummyAsyncAudioEndpoint()
+
+        async def close(self) -> None:
+            pass
+
     dummy_module = types.ModuleType("openai")
     dummy_module.OpenAI = _DummyClient
+    dummy_module.AsyncOpenAI = _DummyAsyncClient
+    dummy_module.DefaultAsyncHttpxClient = lambda **kwargs: kwargs
     monkeypatch.setitem(sys.modules, "openai", dummy_module)
     return dummy_module
@@ -0,0 +1,63 @@
+"""Tests for the PyAV-based audio helpers."""
+
+import wave
+from pathlib import Path
+
+import pytest
+
+from persian_transcriber.utils import audio as audio_utils
+from persian_transcriber.utils.exceptions import AudioProcessingError
+
+
+def test_prepare_audio_uses_16k_wav_directly(mock_audio_file: Path) -> None:
+    prepared, is_temp = audio_utils.prepare_audio_for_transcription(str(mock_audio_file))
+
+    assert prepared == str(mock_audio_file)
+    assert is_temp is False
+
+
+def test_convert_audio_writes_pcm_wav(
+    tmp_path: Path, mock_audio_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    np = pytest.importorskip("numpy")
+
+    def _fake_decode(path, sample_rate=16000, channels=1):  # pylint: disable=unused-argument
+        return np.array([0.0, 0.5, -1.0, 2.0], dtype=np.float32)
+
+    monkeypatch.setattr(audio_utils, "decode_audio", _fake_decode)
+
+    output_path = tmp_path / "converted.wav"
+    audio_utils.convert_audio(str(mock_audio_file), output_path=str(output_path))
+
+    with wave.open(str(output_path), "rb") as wav_file:
+        assert wav_file.getframerate() == 16000
+        assert wav_file.getnchannels() == 1
+        frames = np.frombuffer(wav_file.readframes(4), dtype="<i2")
+    assert frames.tolist() == [0, 16383, -32767, 32767]
+
+    encoded = []
+    monkeypatch.setattr(audio_utils, "_encode_audio", lambda *args: encoded.append(args))
+    mp3_path = audio_utils.convert_audio(str(mock_audio_file), output_format="MP3")
+    assert mp3_path.endswith(".mp3")
+    assert [args[1:] for args in encoded] == [(mp3_path, "mp3", 16000, 1)]
+
+
+def test_iter_audio_windows_splits_stream(monkeypatch: pytest.MonkeyPatch) -> None:
+    np = pytest.importorskip("numpy")
+
+    def _fake_resampled(av, path, sample_rate, channels):  # pylint: disable=unused-argument
+        for start in range(0, 10, 3):
+            yield np.arange(start, min(start + 3, 10), dtype=np.float32)
+
+    monkeypatch.setattr(audio_utils, "_import_av", lambda path: None)
+    monkeypatch.setattr(audio_utils, "_iter_resampled", _fake_resampled)
+
+    windows = list(audio_utils.iter_audio_windows("long.mp3", window_seconds=2, sample_rate=2))
+
+    assert [offset for offset, _ in windows] == [0.0, 2.0, 4.0]
+    assert [samples.tolist() for _, samples in windows] == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+
+
+def test_decode_audio_rejects_unsupported_channel_counts(mock_audio_file: Path) -> None:
+    with pytest.raises(ValueError):
+        audio_utils.decode_audio(mock_audio_file, channels=6)
@@ -5,7 +5,11 @@ from typing import List, Tuple
 
 import pytest
 
-from persian_transcriber.transcriber import PersianAudioTranscriber
+from persian_transcriber.config import EngineConfig, TranscriberConfig
+from persian_transcriber.engines.base import EngineType, TranscriptionResult, TranscriptionSegment
+from persian_transcriber.transcriber import PersianAudioTranscriber, get_transcriber
+from persian_transcriber.utils import audio as audio_utils
+from persian_transcriber.utils.exceptions import AudioProcessingError
 
 
 @pytest.fixture(autouse=True)
@@ -102,3 +106,69 @@ def test_scan_transcribe_collects_errors(tmp_path: Path, monkeypatch: pytest.Mon
 
     assert any(r.get("error") == "boom" and r.get("success") is False for r in results)
     assert any(r.get("file") == str(files[0]) for r in results)
+
+
+def test_get_transcriber_reuses_instances_for_equal_settings() -> None:
+    shared = get_transcriber(model_size="small", device="cpu")
+
+    assert get_transcriber(device="cpu", model_size="small") is shared
+    assert get_transcriber(model_size="tiny", device="cpu") is not shared
+
+    config = TranscriberConfig(engine=EngineConfig(model_size="small", device="cpu"))
+    from_config = get_transcriber(config=config)
+    assert (
+        get_transcriber(
+            config=TranscriberConfig(engine=EngineConfig(model_size="small", device="cpu"))
+        )
+        is from_config
+    )
+    assert from_config.config.engine.model_size == "small"
+
+
+def test_prefetch_decoded_audio_keeps_order_and_skips_failures(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def _fake_decode(path, sample_rate):  # pylint: disable=unused-argument
+        if str(path) == "broken.mp3":
+            raise AudioProcessingError("bad header", file_path=str(path))
+        return f"pcm:{path}"
+
+    monkeypatch.setattr(audio_utils, "decode_audio", _fake_decode)
+
+    decoded = list(audio_utils.prefetch_decoded_audio(["a.mp3", "broken.mp3", "b.mp3"]))
+
+    assert [(path.name, samples) for path, samples in decoded] == [
+        ("a.mp3", "pcm:a.mp3"),
+        ("broken.mp3", None),
+        ("b.mp3", "pcm:b.mp3"),
+    ]
+
+
+def test_transcribe_array_saves_output(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    received = []
+
+    class _FakeEngine:
+        name = "Faster-Whisper"
+        engine_type = EngineType.FASTER_WHISPER
+
+        def transcribe(self, audio, language="fa", **kwargs):
+            received.append((audio, kwargs))
+            return TranscriptionResult(
+                text="سلام",
+                segments=[TranscriptionSegment(text="سلام", start=0.0, end=1.0)],
+                duration=1.0,
+            )
+
+    transcriber = PersianAudioTranscriber(normalize=False)
+    monkeypatch.setattr(transcriber, "_engine", _FakeEngine())
+
+    output_path = tmp_path / "clip.txt"
+    result = transcriber.transcribe_array([0.0] * 16000, output_path=output_path)
+
+    assert received[0][1]["vad_filter"] is True
+    assert result["text"] == "سلام"
+    assert result["output_path"] == str(output_path)
+    assert "سلام" in output_path.read_text(encoding="utf-8")
+
+    with pytest.raises(AudioProcessingError):
+        transcriber.transcribe_array([0.0], sample_rate=8000)
@@ -0,0 +1,75 @@
+"""Tests for the command-line interface."""
+
+from pathlib import Path
+
+import pytest
+
+from persian_transcriber import cli
+from persian_transcriber.engines.base import EngineType
+from persian_transcriber.output import OutputFormat
+from persian_transcriber.utils.exceptions import ConfigurationError
+
+
+def test_parser_choices_match_enums() -> None:
+    assert set(cli.ENGINE_CHOICES) == {e.value for e in EngineType}
+    assert set(cli.FORMAT_CHOICES) == {f.value for f in OutputFormat}
+
+
+def test_create_parser_is_cached() -> None:
+    assert cli.create_parser() is cli.create_parser()
+
+    args = cli.create_parser().parse_args(["audio.mp3", "-m", "tiny"])
+    assert args.model == "tiny"
+    assert cli.create_parser().parse_args(["audio.mp3"]).model == "medium"
+
+
+def test_validate_input(tmp_path: Path) -> None:
+    audio = tmp_path / "clip.MP3"
+    audio.write_bytes(b"fake")
+    notes = tmp_path / "notes.txt"
+    notes.write_text("x")
+
+    assert cli.validate_input(str(audio)) == audio
+    assert cli.validate_input(str(tmp_path)) == tmp_path
+    with pytest.raises(ValueError):
+        cli.validate_input(str(notes))
+    with pytest.raises(FileNotFoundError):
+        cli.validate_input(str(tmp_path / "missing.wav"))
+
+
+def test_progress_printer_buffers_until_flush(capsys: pytest.CaptureFixture) -> None:
+    progress, flush = cli.make_progress_printer(flush_every=2, flush_interval=60)
+
+    progress(1, 5, "a.wav")
+    assert capsys.readouterr().out == ""
+
+    progress(2, 5, "b.wav")
+    assert capsys.readouterr().out == "[1/5] Processing: a.wav\n[2/5] Processing: b.wav\n"
+
+    progress(3, 5, "c.wav")
+    flush()
+    assert capsys.readouterr().out == "[3/5] Processing: c.wav\n"
+
+
+def test_main_fast_paths(capsys: pytest.CaptureFixture) -> None:
+    assert cli.main([]) == 1
+    assert "persian-transcriber --help" in capsys.readouterr().out
+
+    assert cli.main(["--version"]) == 0
+    assert capsys.readouterr().out.startswith("persian-transcriber ")
+
+
+def test_build_config_checks_compute_type_against_engine() -> None:
+    parser = cli.create_parser()
+
+    with pytest.raises(ConfigurationError):
+        cli.build_config(parser.parse_args(["audio.mp3", "--compute-type", "fp16"]))
+    with pytest.raises(ConfigurationError):
+        cli.build_config(
+            parser.parse_args(["audio.mp3", "-e", "whisper_trt", "--compute-type", "bfloat16"])
+        )
+
+    config = cli.build_config(
+        parser.parse_args(["audio.mp3", "-e", "whisper_trt", "--compute-type", "fp16"])
+    )
+    assert config.engine.compute_type == "fp16"
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+import subprocess
 import sys
 from pathlib import Path
 from types import ModuleType, SimpleNamespace
@@ -9,9 +12,12 @@ from typing import Callable, Optional
 
 import pytest
 
+from persian_transcriber.engines.base import TranscriptionResult, TranscriptionSegment
 from persian_transcriber.engines.faster_whisper_engine import FasterWhisperEngine
 from persian_transcriber.engines.openai_api_engine import OpenAIAPIEngine
-from persian_transcriber.utils.exceptions import AuthenticationError, EngineError
+from persian_transcriber.engines.whisper_engine import WhisperEngine
+from persian_transcriber.engines.whisper_trt_engine import WhisperTRTEngine
+from persian_transcriber.utils.exceptions import AuthenticationError, EngineError, ModelLoadError
 
 
 def _patch_whisper_model(
@@ -112,6 +118,25 @@ def test_openai_engine_api_call(
     assert result.language == "fa"
 
 
+def test_openai_engine_async_reuses_client(
+    mock_openai_client, mock_audio_file: Path
+) -> None:  # pylint: disable=unused-argument
+    pytest.importorskip("httpx")
+    engine = OpenAIAPIEngine(api_key="test-key")
+
+    async def _transcribe_all():
+        results = await asyncio.gather(
+            *(engine.transcribe_async(str(mock_audio_file), language="fa") for _ in range(3))
+        )
+        await engine.aclose()
+        return results
+
+    results = asyncio.run(_transcribe_all())
+
+    assert [r.text for r in results] == ["متن تست"] * 3
+    assert mock_openai_client.AsyncOpenAI.instances == 1
+
+
 def test_engine_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
     def _init_hook(*args, **kwargs):
         if kwargs.get("device") == "cuda":
@@ -143,3 +168,146 @@ def test_engine_unsupported_format(monkeypatch: pytest.MonkeyPatch, tmp_path: Pa
 
     with pytest.raises(EngineError):
         engine.transcribe(str(audio_path))
+
+
+def test_engine_auto_compute_type(monkeypatch: pytest.MonkeyPatch) -> None:
+    dummy_ct2 = ModuleType("ctranslate2")
+    dummy_ct2.get_supported_compute_types = lambda device, device_index=0: (
+        {"float32", "float16", "int8", "int8_float16"} if device == "cuda" else {"float32", "int8"}
+    )
+    monkeypatch.setitem(sys.modules, "ctranslate2", dummy_ct2)
+    _patch_device_helpers(monkeypatch, best_device="cuda")
+    _patch_whisper_model(monkeypatch)
+
+    engine = FasterWhisperEngine(model_size="tiny", device="cuda", compute_type="auto")
+    engine.load_model()
+    assert engine.compute_type == "int8_float16"
+
+    engine = FasterWhisperEngine(model_size="tiny", device="cpu", compute_type="auto")
+    engine.load_model()
+    assert engine.compute_type == "int8"
+
+
+def test_engine_auto_accurate_compute_type(monkeypatch: pytest.MonkeyPatch) -> None:
+    dummy_ct2 = ModuleType("ctranslate2")
+    dummy_ct2.get_supported_compute_types = lambda device, device_index=0: {
+        "float32",
+        "int8",
+        "bfloat16",
+    }
+    monkeypatch.setitem(sys.modules, "ctranslate2", dummy_ct2)
+    _patch_device_helpers(monkeypatch)
+    _patch_whisper_model(monkeypatch)
+
+    monkeypatch.setattr("persian_transcriber.utils.cuda_setup.has_avx512_bf16", lambda: True)
+    engine = FasterWhisperEngine(model_size="tiny", device="cpu", compute_type="auto_accurate")
+    engine.load_model()
+    assert engine.compute_type == "bfloat16"
+
+    monkeypatch.setattr("persian_transcriber.utils.cuda_setup.has_avx512_bf16", lambda: False)
+    engine = FasterWhisperEngine(model_size="tiny", device="cpu", compute_type="auto_accurate")
+    engine.load_model()
+    assert engine.compute_type == "float32"
+
+
+def test_engine_forwards_worker_options(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured = {}
+
+    def _init_hook(*args, **kwargs):
+        captured.update(kwargs)
+
+    _patch_device_helpers(monkeypatch, best_device="cuda")
+    _patch_whisper_model(monkeypatch, init_hook=_init_hook)
+
+    engine = FasterWhisperEngine(
+        model_size="small", device="cuda", num_workers=4, cpu_threads=2, device_index=[0, 1]
+    )
+    engine.load_model()
+
+    assert captured["num_workers"] == 4
+    assert captured["cpu_threads"] == 2
+    assert captured["device_index"] == [0, 1]
+
+
+def test_engine_batched_pipeline(monkeypatch: pytest.MonkeyPatch, mock_audio_file: Path) -> None:
+    _patch_device_helpers(monkeypatch, best_device="cuda")
+    _patch_whisper_model(monkeypatch, transcript_text="سلام")
+    batch_sizes = []
+
+    class _DummyPipeline:
+        def __init__(self, model):
+            self.model = model
+
+        def transcribe(self, audio_path: str, batch_size: int = 16, **kwargs):
+            batch_sizes.append(batch_size)
+            return self.model.transcribe(audio_path, **kwargs)
+
+    sys.modules["faster_whisper"].BatchedInferencePipeline = _DummyPipeline
+
+    engine = FasterWhisperEngine(model_size="small", device="cuda", batch_size=8)
+    result = engine.transcribe(str(mock_audio_file))
+
+    assert batch_sizes == [8]
+    assert result.text == "سلام"
+    assert result.metadata["batch_size"] == 8
+
+
+def test_trt_engine_requires_onnx_export(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        WhisperTRTEngine(model_size="large-v3", compute_type="int4")
+
+    with pytest.raises(ValueError):
+        WhisperTRTEngine(model_size="large-v3", device_index=[0, 1])
+    assert WhisperTRTEngine(model_size="large-v3", device_index=[1]).device_index == 1
+
+    engine = WhisperTRTEngine(model_size="large-v3", encoder_onnx=str(tmp_path / "missing.onnx"))
+    assert engine.trt_precision == "fp16"
+    with pytest.raises(ModelLoadError):
+        engine.load_model()
+
+
+def test_whisper_engine_cuda_graphs_need_cuda(
+    monkeypatch: pytest.MonkeyPatch, mock_audio_file: Path
+) -> None:
+    class _DummyWhisper:
+        def transcribe(self, audio_path: str, **kwargs):  # pylint: disable=unused-argument
+            return {"text": "سلام", "segments": [], "language": "fa"}
+
+    whisper_module = ModuleType("whisper")
+    whisper_module.load_model = lambda *args, **kwargs: _DummyWhisper()
+    monkeypatch.setitem(sys.modules, "whisper", whisper_module)
+
+    engine = WhisperEngine(model_size="tiny", device="cpu", use_cuda_graphs=True)
+    result = engine.transcribe(str(mock_audio_file))
+
+    assert result.text == "سلام"
+    assert result.metadata["cuda_graphs"] is False
+
+
+def test_transcription_result_from_dict_round_trip() -> None:
+    result = TranscriptionResult(
+        text="سلام دنیا",
+        segments=[TranscriptionSegment(text="سلام دنیا", start=0.0, end=1.5, confidence=-0.2)],
+        duration=1.5,
+        engine="Faster-Whisper",
+        model="small",
+    )
+
+    assert TranscriptionResult.from_dict(result.to_dict()) == result
+
+
+def test_package_import_defers_engine_modules() -> None:
+    code = (
+        "import sys, persian_transcriber, persian_transcriber.engines; "
+        "print(sorted(m for m in sys.modules if m.endswith('_engine') or m.endswith('transcriber')))"
+    )
+    env_path = str(Path(__file__).resolve().parents[1] / "src")
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": env_path},
+    ).stdout
+
+    assert output.strip() == "['persian_transcriber']"
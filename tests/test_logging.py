@@ -0,0 +1,108 @@
+"""Tests for the package logging helpers."""
+
+# pylint: disable=protected-access
+
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from persian_transcriber.utils import logging as log_utils
+from persian_transcriber.utils.logging import ColoredFormatter, set_log_level
+
+
+def test_colored_formatter_restores_levelname() -> None:
+    formatter = ColoredFormatter(fmt="%(levelname)s %(message)s")
+    formatter.use_colors = True
+    record = logging.LogRecord("persian_transcriber", logging.WARNING, __file__, 1, "hi", (), None)
+
+    output = formatter.format(record)
+
+    assert output == "\033[33mWARNING\033[0m hi"
+    assert record.levelname == "WARNING"
+
+    padded = ColoredFormatter(fmt="%(levelname)-8s| %(message)s")
+    padded.use_colors = True
+    record.levelno, record.levelname = logging.INFO, "INFO"
+    assert padded.format(record) == "\033[32mINFO    \033[0m| hi"
+
+
+def test_set_log_level_accepts_names() -> None:
+    package_logger = logging.getLogger("persian_transcriber")
+    previous = package_logger.level
+    try:
+        set_log_level("warning")
+        assert package_logger.level == logging.WARNING
+        set_log_level("bogus")
+        assert package_logger.level == logging.INFO
+    finally:
+        set_log_level(previous)
+
+
+def test_load_config_reparses_only_changed_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytest.importorskip("yaml")
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("logging:\n  level: DEBUG\n", encoding="utf-8")
+    monkeypatch.setenv("PERSIAN_TRANSCRIBER_CONFIG", str(config_file))
+    log_utils._parse_config.cache_clear()
+
+    assert log_utils._load_config()["level"] == "DEBUG"
+    assert log_utils._load_config()["level"] == "DEBUG"
+    assert log_utils._parse_config.cache_info().misses == 1
+
+    config_file.write_text("logging:\n  level: WARNING\n", encoding="utf-8")
+    os.utime(config_file, ns=(0, 1))
+    assert log_utils._load_config()["level"] == "WARNING"
+
+
+def test_quiet_setup_skips_console_formatter(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _fail(*args, **kwargs):
+        raise AssertionError("console formatter built in quiet mode")
+
+    monkeypatch.setattr(log_utils, "ColoredFormatter", _fail)
+    try:
+        root = log_utils.setup_logging(quiet=True)
+        assert not [h for h in root.handlers if isinstance(h, logging.StreamHandler)]
+    finally:
+        monkeypatch.undo()
+        log_utils.setup_logging()
+
+
+def test_setup_logging_reuses_matching_handlers(tmp_path: Path) -> None:
+    first_log, second_log = tmp_path / "first.log", tmp_path / "second.log"
+    try:
+        root = log_utils.setup_logging(log_file=first_log)
+        console, file_handler = root.handlers
+
+        root = log_utils.setup_logging(level="DEBUG", log_file=first_log)
+        assert root.handlers == [console, file_handler]
+        assert console.level == logging.DEBUG
+
+        set_log_level("ERROR")
+        log_utils.setup_logging(log_file=first_log)
+        assert file_handler.level == logging.DEBUG
+
+        root = log_utils.setup_logging(log_file=second_log)
+        assert root.handlers[0] is console
+        assert root.handlers[1].baseFilename == str(second_log)
+        assert file_handler.stream is None  # Closed once replaced
+    finally:
+        log_utils.setup_logging()
+
+
+def test_expand_log_file_follows_the_clock(monkeypatch: pytest.MonkeyPatch) -> None:
+    days = iter([datetime(2024, 1, 1, 23, 59, 59), datetime(2024, 1, 2, 0, 0, 0)])
+
+    class _Clock:
+        @staticmethod
+        def now() -> datetime:
+            return next(days)
+
+    monkeypatch.setattr(log_utils, "datetime", _Clock)
+
+    assert log_utils._expand_log_file("logs/{date}.log") == Path("logs/2024-01-01.log")
+    assert log_utils._expand_log_file("logs/{date}.log") == Path("logs/2024-01-02.log")
@@ -0,0 +1,84 @@
+"""Tests for the Unix socket transcription server helpers."""
+
+from pathlib import Path
+
+import pytest
+
+from persian_transcriber import server
+from persian_transcriber.config import EngineConfig, TranscriberConfig
+
+
+def test_request_transcription_without_server_returns_none(
+    tmp_path: Path, mock_audio_file: Path
+) -> None:
+    config = TranscriberConfig()
+
+    result = server.request_transcription(
+        mock_audio_file, config, socket_path=str(tmp_path / "missing.sock")
+    )
+
+    assert result is None
+
+
+def test_handle_rejects_mismatched_config(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("persian_transcriber.transcriber.setup_cuda_paths", lambda: None)
+    from persian_transcriber.transcriber import PersianAudioTranscriber
+
+    transcriber = PersianAudioTranscriber(config=TranscriberConfig())
+    other = TranscriberConfig(engine=EngineConfig(model_size="tiny"))
+
+    response = server._handle(  # pylint: disable=protected-access
+        transcriber, {"path": "audio.wav", "config": server._config_key(other)}
+    )
+
+    assert response["ok"] is False
+    assert response["mismatch"] is True
+
+
+def test_default_socket_path_prefers_runtime_dir(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv(server.SOCKET_ENV_VAR, raising=False)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+
+    assert server.default_socket_path() == str(tmp_path / "persian-transcriber.sock")
+
+
+def test_request_transcription_ignores_untrusted_socket(
+    tmp_path: Path, mock_audio_file: Path
+) -> None:
+    impostor = tmp_path / "impostor.sock"
+    impostor.write_bytes(b"")  # Not a socket
+
+    result = server.request_transcription(
+        mock_audio_file, TranscriberConfig(), socket_path=str(impostor)
+    )
+
+    assert result is None
+
+
+def test_handle_rejects_unknown_options(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("persian_transcriber.transcriber.setup_cuda_paths", lambda: None)
+    from persian_transcriber.transcriber import PersianAudioTranscriber
+
+    transcriber = PersianAudioTranscriber(config=TranscriberConfig())
+    request = {
+        "path": "audio.wav",
+        "config": server._config_key(transcriber.config),  # pylint: disable=protected-access
+        "options": {"beam_size": 99},
+    }
+
+    response = server._handle(transcriber, request)  # pylint: disable=protected-access
+
+    assert response == {"ok": False, "error": "Unsupported request options"}
+
+
+def test_handle_rejects_malformed_request(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("persian_transcriber.transcriber.setup_cuda_paths", lambda: None)
+    from persian_transcriber.transcriber import PersianAudioTranscriber
+
+    transcriber = PersianAudioTranscriber(config=TranscriberConfig())
+
+    response = server._handle(transcriber, ["not", "a", "dict"])  # pylint: disable=protected-access
+
+    assert response == {"ok": False, "error": "Malformed request"}